@@ -79,6 +79,10 @@ def main():
     decode_parser.add_argument('-j', '--json',
                                action='store_true',
                                help='Output as JSON')
+    decode_parser.add_argument('--fast-json',
+                               action='store_true',
+                               help='Serialize JSON output with orjson if it is installed. '
+                                    'The output is compact and non-ASCII characters are not escaped.')
     decode_parser.add_argument('-a', '--attributed',
                                action='store_true',
                                help='Wire data to be attributed and nested')
@@ -222,6 +226,10 @@ def main():
     query_parser.add_argument('-j', '--json',
                               action='store_true',
                               help='Output as JSON')
+    query_parser.add_argument('--fast-json',
+                              action='store_true',
+                              help='Serialize JSON output with orjson if it is installed. '
+                                   'The output is compact and non-ASCII characters are not escaped.')
     query_parser.add_argument('-n', '--nested',
                               action='store_true',
                               help='Output as nested JSON')
@@ -7,11 +7,10 @@ from __future__ import absolute_import
 from __future__ import print_function
 
 import abc
-import six
 
 from pybufrkit.constants import (NBITS_PER_BYTE,
                                  NUMERIC_MISSING_VALUES)
-from pybufrkit.errors import BitReadError
+from pybufrkit.errors import BitReadError, BitWriteError
 
 
 class BitReader(object):
@@ -55,6 +54,10 @@ class BitReader(object):
             value = None
         return value
 
+    def read_uints(self, nbits, n):
+        """Read n consecutive unsigned integers of the same number of bits"""
+        return [self.read_uint(nbits) for _ in range(n)]
+
 
 class BitWriter(object):
     @abc.abstractmethod
@@ -111,6 +114,22 @@ class BitWriter(object):
         """
 
 
+# Format strings for reading with bitstring keyed by type and number of bits.
+# They are created once instead of being formatted for every read.
+_bitstring_fmt_strings = {}
+
+
+def _bitstring_fmt_string(data_type, nbits):
+    fmt_string = _bitstring_fmt_strings.get((data_type, nbits))
+    if fmt_string is None:
+        if data_type == 'uint' and nbits % NBITS_PER_BYTE == 0:
+            fmt_string = 'uintbe:{}'.format(nbits)
+        else:
+            fmt_string = '{}:{}'.format(data_type, nbits)
+        _bitstring_fmt_strings[(data_type, nbits)] = fmt_string
+    return fmt_string
+
+
 class BitStringBitReader(BitReader):
     """
     A BitReader implementation using the bitstring module.
@@ -140,17 +159,88 @@ class BitStringBitReader(BitReader):
             raise BitReadError(e.msg)
 
     def read_bytes(self, nbytes):
-        return self._bit_stream_read('bytes:{}'.format(nbytes))
+        return self._bit_stream_read(_bitstring_fmt_string('bytes', nbytes))
 
     def read_uint(self, nbits):
-        fmt_string = ('uintbe:{}' if nbits % NBITS_PER_BYTE == 0 else 'uint:{}').format(nbits)
-        return self._bit_stream_read(fmt_string)
+        return self._bit_stream_read(_bitstring_fmt_string('uint', nbits))
 
     def read_bool(self):
         return self._bit_stream_read('bool')
 
     def read_bin(self, nbits):
-        return self._bit_stream_read('bin:{}'.format(nbits))
+        return self._bit_stream_read(_bitstring_fmt_string('bin', nbits))
+
+    def read_int(self, nbits):
+        return (-1 if self.read_bool() else 1) * self.read_uint(nbits - 1)
+
+
+class BytesBitReader(BitReader):
+    """
+    A BitReader implementation that reads directly from the given bytes. Each
+    read converts just the bytes covering the requested bits to an integer and
+    then shifts and masks out the bits. Unlike bitstring, no format string is
+    created and parsed for every read.
+
+    :param s: The byte string to read from.
+    """
+
+    def __init__(self, s):
+        self.s = s
+        self.pos = 0
+        self.nbits_total = len(s) * NBITS_PER_BYTE
+
+    def get_pos(self):
+        return self.pos
+
+    def read_bytes(self, nbytes):
+        pos = self.pos
+        if pos % NBITS_PER_BYTE == 0:
+            idx_byte = pos // NBITS_PER_BYTE
+            if pos + nbytes * NBITS_PER_BYTE > self.nbits_total:
+                raise BitReadError('Reading off the end of the data. Position {}, {} bytes requested'.format(
+                    pos, nbytes))
+            self.pos = pos + nbytes * NBITS_PER_BYTE
+            return self.s[idx_byte: idx_byte + nbytes]
+
+        return self.read_uint(nbytes * NBITS_PER_BYTE).to_bytes(nbytes, 'big')
+
+    def read_uint(self, nbits):
+        pos = self.pos
+        pos_end = pos + nbits
+        if pos_end > self.nbits_total:
+            raise BitReadError('Reading off the end of the data. Position {}, {} bits requested'.format(
+                pos, nbits))
+        self.pos = pos_end
+
+        idx_byte_end = (pos_end + NBITS_PER_BYTE - 1) // NBITS_PER_BYTE
+        value = int.from_bytes(self.s[pos // NBITS_PER_BYTE: idx_byte_end], 'big')
+        return (value >> (idx_byte_end * NBITS_PER_BYTE - pos_end)) & ((1 << nbits) - 1)
+
+    def read_uints(self, nbits, n):
+        pos = self.pos
+        pos_end = pos + nbits * n
+        if pos_end > self.nbits_total:
+            raise BitReadError('Reading off the end of the data. Position {}, {} x {} bits requested'.format(
+                pos, n, nbits))
+        if nbits == 0:
+            return [0] * n
+
+        s = self.s
+        mask = (1 << nbits) - 1
+        values = []
+        for value_pos in range(pos, pos_end, nbits):
+            pos_value_end = value_pos + nbits
+            idx_byte_end = (pos_value_end + NBITS_PER_BYTE - 1) // NBITS_PER_BYTE
+            value = int.from_bytes(s[value_pos // NBITS_PER_BYTE: idx_byte_end], 'big')
+            values.append((value >> (idx_byte_end * NBITS_PER_BYTE - pos_value_end)) & mask)
+        self.pos = pos_end
+        return values
+
+    def read_bool(self):
+        return self.read_uint(1) == 1
+
+    def read_bin(self, nbits):
+        return '{:0{}b}'.format(self.read_uint(nbits), nbits) if nbits else ''
 
     def read_int(self, nbits):
         return (-1 if self.read_bool() else 1) * self.read_uint(nbits - 1)
@@ -178,7 +268,7 @@ class BitStringBitWriter(BitWriter):
     def write_bytes(self, value, nbytes=None):
         import bitstring
         # TODO: strings are utf-8 from json reading
-        if isinstance(value, six.text_type):
+        if isinstance(value, str):
             value = value.encode('latin-1')
 
         value_len = len(value)
@@ -227,6 +317,123 @@ class BitStringBitWriter(BitWriter):
         self.bit_stream[bitpos: bitpos + nbits] = bins
 
 
+class BytesBitWriter(BitWriter):
+    """
+    A BitWriter implementation that packs bits directly into a bytearray. Bits
+    that do not yet make up a whole byte are kept as a pending integer. Byte
+    aligned writes are appended with int.to_bytes without any format string
+    being created and parsed as is the case for bitstring.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.pending = 0
+        self.nbits_pending = 0
+
+    def get_pos(self):
+        return len(self.buffer) * NBITS_PER_BYTE + self.nbits_pending
+
+    def to_bytes(self):
+        if self.nbits_pending:
+            return bytes(self.buffer) + bytes([self.pending << (NBITS_PER_BYTE - self.nbits_pending)])
+        return bytes(self.buffer)
+
+    def _write_bits(self, value, nbits):
+        """
+        Append the given number of bits of a non-negative integer value which
+        is known to fit into the number of bits.
+        """
+        nbits_pending = self.nbits_pending
+        if nbits_pending == 0 and nbits % NBITS_PER_BYTE == 0:
+            self.buffer += value.to_bytes(nbits // NBITS_PER_BYTE, 'big')
+            return
+
+        value |= self.pending << nbits
+        nbits += nbits_pending
+        nbits_pending = nbits % NBITS_PER_BYTE
+        if nbits >= NBITS_PER_BYTE:
+            self.buffer += (value >> nbits_pending).to_bytes(nbits // NBITS_PER_BYTE, 'big')
+            value &= (1 << nbits_pending) - 1
+        self.pending = value
+        self.nbits_pending = nbits_pending
+
+    def skip(self, nbits):
+        self._write_bits(0, nbits)
+
+    def write_bytes(self, value, nbytes=None):
+        # TODO: strings are utf-8 from json reading
+        if isinstance(value, str):
+            value = value.encode('latin-1')
+
+        value_len = len(value)
+
+        # Ensure the string is under the required data width
+        if nbytes is None:
+            nbytes = value_len
+        else:
+            if value_len > nbytes:
+                value = value[:nbytes]
+            elif value_len < nbytes:
+                value += b' ' * (nbytes - value_len)
+
+        if self.nbits_pending == 0:
+            self.buffer += value
+        else:
+            self._write_bits(int.from_bytes(value, 'big'), nbytes * NBITS_PER_BYTE)
+        return value
+
+    def write_uint(self, value, nbits):
+        value = int(value)
+        if not 0 <= value < (1 << nbits):
+            raise BitWriteError('Value {} does not fit into {} bits as unsigned integer'.format(value, nbits))
+        self._write_bits(value, nbits)
+        return value
+
+    def write_int(self, value, nbits):
+        value = int(value)
+        self.write_bool(value < 0)
+        self.write_uint(abs(value), nbits - 1)
+        return value
+
+    def write_bool(self, value):
+        self._write_bits(1 if value else 0, 1)
+        return value
+
+    def write_bin(self, value):
+        nbits = len(value)
+        if nbits:
+            self._write_bits(int(value, 2), nbits)
+        return value
+
+    def set_uint(self, value, nbits, bitpos):
+        if not 0 <= value < (1 << nbits):
+            raise BitWriteError('Value {} does not fit into {} bits as unsigned integer'.format(value, nbits))
+        bitpos_end = bitpos + nbits
+        if bitpos_end > self.get_pos():
+            raise BitWriteError('Cannot set {} bits at position {} beyond the end of the data'.format(
+                nbits, bitpos))
+
+        buffer = self.buffer
+        idx_byte_start = bitpos // NBITS_PER_BYTE
+        # Also include the pending bits if the value extends into them
+        with_pending = bitpos_end > len(buffer) * NBITS_PER_BYTE
+        idx_byte_end = len(buffer) if with_pending else (bitpos_end + NBITS_PER_BYTE - 1) // NBITS_PER_BYTE
+
+        nbits_region = (idx_byte_end - idx_byte_start) * NBITS_PER_BYTE
+        region = int.from_bytes(buffer[idx_byte_start: idx_byte_end], 'big')
+        if with_pending:
+            nbits_region += self.nbits_pending
+            region = (region << self.nbits_pending) | self.pending
+
+        shift = idx_byte_start * NBITS_PER_BYTE + nbits_region - bitpos_end
+        region = (region & ~(((1 << nbits) - 1) << shift)) | (value << shift)
+
+        if with_pending:
+            self.pending = region & ((1 << self.nbits_pending) - 1)
+            region >>= self.nbits_pending
+        buffer[idx_byte_start: idx_byte_end] = region.to_bytes(idx_byte_end - idx_byte_start, 'big')
+
+
 def get_bit_reader(s):
     """
     Initialise and return a BitReader the given string. This function is
@@ -236,7 +443,7 @@ def get_bit_reader(s):
     :param s: The byte string to read from.
     :return: BitReader
     """
-    return BitStringBitReader(s)
+    return BytesBitReader(s)
 
 
 def get_bit_writer():
@@ -245,4 +452,4 @@ def get_bit_writer():
 
     :return: BitWriter
     """
-    return BitStringBitWriter()
+    return BytesBitWriter()
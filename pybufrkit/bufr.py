@@ -10,14 +10,12 @@ from __future__ import print_function
 import json
 import os
 import logging
-import six
 from copy import deepcopy
-from collections import OrderedDict
 from datetime import datetime
 
 from pybufrkit.errors import PyBufrKitError
 from pybufrkit.constants import BASE_DIR, NBITS_PER_BYTE, PARAMETER_TYPE_TEMPLATE_DATA
-from pybufrkit.tables import TableGroupCacheManager
+from pybufrkit.tables import TableGroupCacheManager, template_from_ids
 
 log = logging.getLogger(__file__)
 
@@ -34,7 +32,7 @@ class SectionParameter(object):
         self.type = data_type
         # All string type expectation value should be of bytes type not unicode.
         # This is true since current BUFR spec only work with ascii chars.
-        if isinstance(expected, six.text_type):
+        if isinstance(expected, str):
             expected = expected.encode('utf-8')
         self.expected = expected
         self.as_property = as_property
@@ -42,9 +40,9 @@ class SectionParameter(object):
         self.value = value
 
 
-class SectionNamespace(OrderedDict):
+class SectionNamespace(dict):
     """
-    A Section Namespace is an ordered dictionary that store the decoded
+    A Section Namespace is an (insertion) ordered dictionary that store the decoded
     parameters with their names as the keys.
     """
 
@@ -338,7 +336,10 @@ class BufrMessage(object):
         :param tables_root_dir: The root directory to find BUFR tables
         :param normalize: Whether to use some default table group if the specific
             one is not available.
-        :return: A tuple of BufrTemplate and the associated TableGroup
+        :return: A tuple of BufrTemplate and the associated TableGroup. The
+            BufrTemplate is cached and shared between messages with the same
+            descriptors, e.g. as the template of their template data, so it
+            must not be mutated.
         """
         table_group = TableGroupCacheManager.get_table_group(
             tables_root_dir=tables_root_dir,
@@ -351,7 +352,7 @@ class BufrMessage(object):
         )
         self.table_group_key = table_group.key
 
-        return table_group.template_from_ids(*self.unexpanded_descriptors.value), table_group
+        return template_from_ids(table_group, tuple(self.unexpanded_descriptors.value)), table_group
 
     def wire(self):
         """
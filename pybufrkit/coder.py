@@ -8,12 +8,8 @@ from __future__ import print_function
 
 import logging
 import abc
-import functools
 from collections import namedtuple
 
-# noinspection PyUnresolvedReferences
-from six.moves import range, zip
-
 from pybufrkit.constants import (DEFAULT_TABLES_DIR,
                                  UNITS_CODE_TABLE,
                                  UNITS_FLAG_TABLE,
@@ -40,6 +36,10 @@ QA_INFO_NA = 0  # no in QA info follows range
 QA_INFO_WAITING = 1  # after seeing 222000
 QA_INFO_PROCESSING = 2  # after seeing the first class 33 descriptor
 
+# Pre-computed 10 ** scale for the range of scales seen in practice. Scales
+# outside of the range are computed on demand.
+SCALES_POWERED = {scale: 1.0 * 10 ** scale for scale in range(-20, 21)}
+
 # Modifier for nbits, scale and reference value
 BSRModifier = namedtuple('BSRModifier',
                          ['nbits_increment', 'scale_increment', 'refval_factor'])
@@ -166,7 +166,7 @@ class CoderState(object):
         self.back_reference_boundary = len(self.decoded_descriptors)
 
     def recall_bitmap(self):
-        self.next_bitmapped_descriptor = functools.partial(next, iter(self.bitmapped_descriptors))
+        self.next_bitmapped_descriptor = iter(self.bitmapped_descriptors).__next__
         return self.bitmap
 
     def cancel_bitmap(self):
@@ -203,14 +203,17 @@ class CoderState(object):
         """
         # Second get all the back referenced descriptors if it does not already exist
         if not self.back_referenced_descriptors:
-            self.back_referenced_descriptors = []
+            back_referenced_descriptors = []
             for idx in range(self.back_reference_boundary - 1, -1, -1):
                 descriptor = self.decoded_descriptors[idx]
                 # The type has to be an exact match, not just isinstance
                 if type(descriptor) is ElementDescriptor:
-                    self.back_referenced_descriptors.insert(0, (idx, descriptor))
-                    if len(self.back_referenced_descriptors) == len(bitmap):
+                    back_referenced_descriptors.append((idx, descriptor))
+                    if len(back_referenced_descriptors) == len(bitmap):
                         break
+            # Collected backwards, reverse once instead of inserting each at the front
+            back_referenced_descriptors.reverse()
+            self.back_referenced_descriptors = back_referenced_descriptors
         if len(self.back_referenced_descriptors) != len(bitmap):
             raise PyBufrKitError('Back referenced descriptors not matching defined Bitmap')
 
@@ -221,7 +224,7 @@ class CoderState(object):
                 self.back_referenced_descriptors
             ) if bit == 0
         ]
-        self.next_bitmapped_descriptor = functools.partial(next, iter(self.bitmapped_descriptors))
+        self.next_bitmapped_descriptor = iter(self.bitmapped_descriptors).__next__
 
     def _assert_equal_values_of_index(self, idx):
         """
@@ -237,14 +240,11 @@ class CoderState(object):
         """
         Give a list of values, find out the minimum and maximum, ignore any Nones.
         """
-        mn, mx = None, None
-        for v in values:
-            if v is not None:
-                if mn is None or mn > v:
-                    mn = v
-                if mx is None or mx < v:
-                    mx = v
-        return mn, mx
+        values = [v for v in values if v is not None]
+        if not values:
+            return None, None
+        # Built-in min and max do the scanning in C
+        return min(values), max(values)
 
 
 class Coder(object):
@@ -298,15 +298,14 @@ class Coder(object):
         for member in members:
             member_type = type(member)
 
-            log.debug('Processing {} {}'.format(member, member.name if hasattr(member, 'name') else ''))
-
             # TODO: NOT using if-elif for following checks because they may co-exist???
             #      It is highly unlikely if not impossible
 
             # 221 YYY data not present for following YYY descriptors except class 0-9 and 31
+            # This is checked first so that skipped members are done with straight away.
             if state.data_not_present_count:
                 state.data_not_present_count -= 1
-                log.debug('Data not present: {} to go'.format(state.data_not_present_count))
+                log.debug('Data not present: %s to go', state.data_not_present_count)
 
                 if member_type is ElementDescriptor:
                     X = member.X
@@ -315,6 +314,9 @@ class Coder(object):
                         # TODO: maybe the descriptor should still be kept and set its value to None?
                         #       So it helps to keep the structure intact??
 
+            # Arguments are passed to the logger for lazy formatting as this runs for every member
+            log.debug('Processing %s %s', member, getattr(member, 'name', ''))
+
             # Currently defining new reference values
             # For ElementDescriptor only. This makes sense though not explicitly stated in the manual
             if state.nbits_of_new_refval and member_type is ElementDescriptor:
@@ -436,7 +438,7 @@ class Coder(object):
         # Read associated field if exists
         # Page 79 of layer 3 Guide, operators do not apply to class 31 element descriptor
         if state.nbits_of_associated and X != 31:
-            log.debug('Processing associated field of {} bits'.format(state.nbits_of_associated))
+            log.debug('Processing associated field of %s bits', state.nbits_of_associated)
             self.process_associated_field(state, bit_operator, descriptor)
 
         # Handle class 33 codes for QA information follows 222000 operator
@@ -459,22 +461,25 @@ class Coder(object):
             self.process_codeflag(state, bit_operator, descriptor, descriptor.nbits)
 
         else:
+            bsr_modifier = state.bsr_modifier
             nbits = (descriptor.nbits +
                      state.nbits_offset +
-                     state.bsr_modifier.nbits_increment)
+                     bsr_modifier.nbits_increment)
             scale = (descriptor.scale +
                      state.scale_offset +
-                     state.bsr_modifier.scale_increment)
-            scale_powered = 1.0 * 10 ** scale
+                     bsr_modifier.scale_increment)
+            scale_powered = SCALES_POWERED.get(scale)
+            if scale_powered is None:
+                scale_powered = 1.0 * 10 ** scale
 
             if descriptor.id not in state.new_refvals:  # no new refval is defined for this descriptor
-                refval = descriptor.refval * state.bsr_modifier.refval_factor
+                refval = descriptor.refval * bsr_modifier.refval_factor
                 self.process_numeric(state, bit_operator, descriptor, nbits, scale_powered, refval)
 
             else:  # a new refval is defined for the descriptor, it must be retrieved at runtime
                 self.process_numeric_of_new_refval(state, bit_operator,
                                                    descriptor, nbits, scale_powered,
-                                                   state.bsr_modifier.refval_factor)
+                                                   bsr_modifier.refval_factor)
 
     def process_fixed_replication_descriptor(self, state, bit_operator, descriptor):
         """
@@ -500,7 +505,7 @@ class Coder(object):
         if descriptor.id in (31011, 31012):
             raise NotImplementedError('delayed repetition descriptor')
 
-        log.debug('Processing {}'.format(descriptor.factor))
+        log.debug('Processing %s', descriptor.factor)
         self.process_element_descriptor(state, bit_operator, descriptor.factor)
         for _ in range(self.get_value_for_delayed_replication_factor(state)):
             self.process_members(state, bit_operator, descriptor.members)
@@ -10,7 +10,6 @@ from __future__ import absolute_import
 import os
 import sys
 import json
-import six
 
 from pybufrkit.constants import (UNITS_CODE_TABLE,
                                  UNITS_COMMON_CODE_TABLE_C1,
@@ -21,7 +20,7 @@ from pybufrkit.descriptors import ElementDescriptor
 from pybufrkit.tables import TableGroupCacheManager
 from pybufrkit.decoder import Decoder, generate_bufr_message
 from pybufrkit.encoder import Encoder
-from pybufrkit.utils import JSON_DUMPS_KWARGS
+from pybufrkit.utils import json_dumps
 from pybufrkit.renderer import FlatTextRenderer, NestedTextRenderer, FlatJsonRenderer, NestedJsonRenderer
 
 __all__ = ['command_decode', 'command_info', 'command_encode',
@@ -42,12 +41,12 @@ def command_decode(ns):
         if ns.attributed:
             m.wire()
             if ns.json:
-                print(json.dumps(NestedJsonRenderer().render(m), **JSON_DUMPS_KWARGS))
+                print(json_dumps(NestedJsonRenderer().render(m), fast=ns.fast_json))
             else:
                 print(NestedTextRenderer().render(m))
         else:
             if ns.json:
-                print(json.dumps(FlatJsonRenderer().render(m), **JSON_DUMPS_KWARGS))
+                print(json_dumps(FlatJsonRenderer().render(m), fast=ns.fast_json))
             else:
                 print(FlatTextRenderer().render(m))
 
@@ -203,13 +202,7 @@ def command_lookup(ns):
                 code_and_flag = table_group.B.code_and_flag_for_descriptor(descriptor)
                 if code_and_flag:
                     for v, description in code_and_flag:
-                        output = u'{:8d} {}'.format(v, description)
-                        # With Python 2, some terminal utilities, e.g. more, redirect to file,
-                        # cause errors when unicode string is printed. The fix is to encode
-                        # them before print.
-                        if six.PY2:
-                            output = output.encode('utf-8', 'ignore')
-                        print(output)
+                        print('{:8d} {}'.format(v, description))
         else:
             print(flat_text_render.render(descriptor))
 
@@ -218,8 +211,7 @@ def command_compile(ns):
     """
     Command to compile the given descriptors.
     """
-    from pybufrkit.templatecompiler import TemplateCompiler
-    template_compiler = TemplateCompiler()
+    from pybufrkit.templatecompiler import compile_template
 
     if os.path.exists(ns.input):
         decoder = Decoder(definitions_dir=ns.definitions_directory,
@@ -237,7 +229,7 @@ def command_compile(ns):
         descriptor_ids = [x.strip() for x in ns.input.split(',')]
         template = table_group.template_from_ids(*descriptor_ids)
 
-    compiled_template = template_compiler.process(template, table_group)
+    compiled_template = compile_template(template, table_group)
     print(json.dumps(compiled_template.to_dict()))
 
 
@@ -294,9 +286,9 @@ def command_query(ns):
             query_result = querent.query(bufr_message, ns.query_string)
             if ns.json:
                 if ns.nested:
-                    print(json.dumps(NestedJsonRenderer().render(query_result), **JSON_DUMPS_KWARGS))
+                    print(json_dumps(NestedJsonRenderer().render(query_result), fast=ns.fast_json))
                 else:
-                    print(json.dumps(FlatJsonRenderer().render(query_result), **JSON_DUMPS_KWARGS))
+                    print(json_dumps(FlatJsonRenderer().render(query_result), fast=ns.fast_json))
             else:
                 print(filename)
                 print(FlatTextRenderer().render(query_result))
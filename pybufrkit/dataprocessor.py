@@ -1,7 +1,6 @@
 from __future__ import absolute_import
 from __future__ import print_function
 
-import six
 import itertools
 from pybufrkit.descriptors import flat_member_ids
 from pybufrkit.templatedata import FixedReplicationNode, DelayedReplicationNode
@@ -32,7 +31,7 @@ class BufrTableDefinitionProcessor(object):
 
         def get_decoded_values():
             value = decoded_values[next(vc)]
-            if isinstance(value, six.binary_type):
+            if isinstance(value, bytes):
                 value = value.decode()
             return value
 
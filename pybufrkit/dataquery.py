@@ -8,7 +8,7 @@ from __future__ import print_function
 
 import logging
 import string
-from collections import namedtuple, OrderedDict
+from collections import namedtuple
 
 from pybufrkit.errors import PathExprParsingError, QueryError
 from pybufrkit.templatedata import (
@@ -291,7 +291,7 @@ class QueryResult(object):
 
     def __init__(self, path_expr=''):
         self.path_expr = path_expr
-        self.results = OrderedDict()
+        self.results = {}
 
     def add_subset(self, i_subset, values):
         self.results[i_subset] = values
@@ -503,7 +503,7 @@ class DataQuerent(object):
         """
 
         log.debug('filter attribute sub-nodes for {}'.format(node))
-        if not (hasattr(node, 'attributes') or hasattr(node, 'factor')):
+        if not (getattr(node, 'attributes', None) or hasattr(node, 'factor')):
             raise QueryError('{} has no attribute nodes'.format(node.descriptor))
 
         path_component = path_components[0]
@@ -512,7 +512,7 @@ class DataQuerent(object):
         if isinstance(node, DelayedReplicationNode):
             sub_nodes += self.filter_for_nodes([node.factor], path_component)
 
-        if hasattr(node, 'attributes'):
+        if getattr(node, 'attributes', None):
             sub_nodes += self.filter_for_nodes(node.attributes, path_component)
 
         if sub_nodes:
@@ -532,7 +532,7 @@ class DataQuerent(object):
         components till every component is matched or zero match is encountered.
         """
         log.debug('filter descendant sub-nodes for {}'.format(node))
-        if not (hasattr(node, 'members') or hasattr(node, 'attributes') or hasattr(node, 'factor')):
+        if not (hasattr(node, 'members') or getattr(node, 'attributes', None) or hasattr(node, 'factor')):
             raise QueryError('{} has no descendant nodes'.format(node.descriptor))
 
         sub_nodes = []
@@ -540,7 +540,7 @@ class DataQuerent(object):
             child_sub_nodes = self.filter_for_child_sub_nodes(node, path_components)
             sub_nodes += child_sub_nodes
 
-        if hasattr(node, 'attributes') or hasattr(node, 'factor'):
+        if getattr(node, 'attributes', None) or hasattr(node, 'factor'):
             attrib_sub_nodes = self.filter_for_attribute_sub_nodes(node, path_components)
             sub_nodes += attrib_sub_nodes
 
@@ -653,7 +653,7 @@ class DataQuerent(object):
         # candidate as there might matches with its descendant nodes.
         if not matched and path_component.separator == PATH_SEPARATOR_DESCEND:
             matched = (
-                hasattr(node, 'members') or hasattr(node, 'attributes') or hasattr(node, 'factor')
+                hasattr(node, 'members') or getattr(node, 'attributes', None) or hasattr(node, 'factor')
             )
             return NODE_KEEP if matched else NODE_NOT_MATCH
 
@@ -9,8 +9,6 @@ from __future__ import print_function
 import sys
 import functools
 import logging
-# noinspection PyUnresolvedReferences
-from six.moves import range
 
 from pybufrkit.constants import (BITPOS_START,
                                  MESSAGE_START_SIGNATURE,
@@ -44,13 +42,15 @@ class Decoder(Coder):
     def __init__(self,
                  definitions_dir=None,
                  tables_root_dir=None,
-                 compiled_template_cache_max=None):
+                 compiled_template_cache_max=None,
+                 compiled_template_use_python_func=True):
 
         super(Decoder, self).__init__(definitions_dir, tables_root_dir)
 
         # Only enable template compilation if cache is requested
         if compiled_template_cache_max is not None:
-            self.compiled_template_manager = CompiledTemplateManager(compiled_template_cache_max)
+            self.compiled_template_manager = CompiledTemplateManager(
+                compiled_template_cache_max, use_python_func=compiled_template_use_python_func)
             log.debug('Template compilation enabled with cache size of {}'.format(compiled_template_cache_max))
         else:
             self.compiled_template_manager = None
@@ -133,7 +133,7 @@ class Decoder(Coder):
             else:
                 parameter.value = bit_reader.read(parameter.type, parameter.nbits)
 
-            log.debug('{} = {!r}'.format(parameter.name, parameter.value))
+            log.debug('%s = %r', parameter.name, parameter.value)
 
             # Make available as a property of the overall message object
             if parameter.as_property:
@@ -169,10 +169,9 @@ class Decoder(Coder):
         unexpanded_descriptors = []
         nbytes_read = (bit_reader.get_pos() - section.get_metadata(BITPOS_START)) // NBITS_PER_BYTE
         for _ in range((section.section_length.value - nbytes_read) // 2):
-            f = bit_reader.read_uint(2)
-            x = bit_reader.read_uint(6)
-            y = bit_reader.read_uint(8)
-            unexpanded_descriptors.append(f * 100000 + x * 1000 + y)
+            # Read F (2 bits), X (6 bits) and Y (8 bits) with a single read
+            fxy = bit_reader.read_uint(16)
+            unexpanded_descriptors.append((fxy >> 14) * 100000 + ((fxy >> 8) & 0x3f) * 1000 + (fxy & 0xff))
 
         return unexpanded_descriptors
 
@@ -191,7 +190,9 @@ class Decoder(Coder):
 
         if self.compiled_template_manager:
             template_to_process = self.compiled_template_manager.get_or_compile(bufr_template, table_group)
-            template_processing_func = functools.partial(process_compiled_template, self)
+            template_processing_func = functools.partial(
+                process_compiled_template, self,
+                use_python_func=self.compiled_template_manager.use_python_func)
         else:
             template_to_process = bufr_template
             template_processing_func = self.process_template
@@ -271,12 +272,12 @@ class Decoder(Coder):
             for decoded_values in state.decoded_values_all_subsets:
                 decoded_values.append(value)
         else:
-            for decoded_values in state.decoded_values_all_subsets:
-                diff = bit_reader.read_uint_or_none(nbits_diff)
-                # A one-bit increment of value one is considered as missing
-                if diff == 1 and nbits_diff == 1:
-                    diff = None
-                if diff is None:
+            # Read the increments of all subsets in one go. An increment of all
+            # ones is missing, including a one-bit increment of value one.
+            diffs = bit_reader.read_uints(nbits_diff, state.n_subsets)
+            missing_diff = NUMERIC_MISSING_VALUES[nbits_diff]
+            for decoded_values, diff in zip(state.decoded_values_all_subsets, diffs):
+                if diff == missing_diff:
                     value = None
                 else:
                     value = min_value + diff
@@ -333,12 +334,12 @@ class Decoder(Coder):
             for decoded_values in state.decoded_values_all_subsets:
                 decoded_values.append(min_value)
         else:
-            for decoded_values in state.decoded_values_all_subsets:
-                diff = bit_reader.read_uint_or_none(nbits_diff)
-                # A one-bit increment of value one is considered as missing
-                if diff == 1 and nbits_diff == 1:
-                    diff = None
-                if diff is None:
+            # Read the increments of all subsets in one go. An increment of all
+            # ones is missing, including a one-bit increment of value one.
+            diffs = bit_reader.read_uints(nbits_diff, state.n_subsets)
+            missing_diff = NUMERIC_MISSING_VALUES[nbits_diff]
+            for decoded_values, diff in zip(state.decoded_values_all_subsets, diffs):
+                if diff == missing_diff:
                     value = None
                 else:
                     value = min_value + diff
@@ -330,6 +330,7 @@ class BufrTemplate(SequenceDescriptor):
 
     def __init__(self, id_=999999, name='', members=None):
         super(BufrTemplate, self).__init__(id_, name, members)
+        self._original_descriptor_ids = None
 
     def __str__(self):
         return 'BufrTemplate'
@@ -337,21 +338,40 @@ class BufrTemplate(SequenceDescriptor):
     @property
     def original_descriptor_ids(self):
         """
-        Get the list of descriptor IDs that can be used to instantiate the Template.
+        Get the descriptor IDs that can be used to instantiate the Template.
 
-        :rtype [int]
+        :rtype: list
         """
+        return list(self.original_descriptor_ids_key)
+
+    @property
+    def original_descriptor_ids_key(self):
+        """
+        The original descriptor IDs as a tuple, which can be used as part of a
+        key, e.g. to lookup compiled templates. It is worked out on first access
+        and cached afterwards.
+
+        :rtype: tuple
+        """
+        if self._original_descriptor_ids is None:
+            self._original_descriptor_ids = self._build_original_descriptor_ids()
+        return self._original_descriptor_ids
+
+    def _build_original_descriptor_ids(self):
         ret = []
-        members = list(self.members)
+        # Members are kept in reverse order so the next one is always popped from
+        # the end. Popping from the front and prepending replicated members
+        # would copy the entire remaining list every time.
+        members = list(reversed(self.members))
         while members:
-            member = members.pop(0)
+            member = members.pop()
             ret.append(member.id)
             if isinstance(member, ReplicationDescriptor):
                 if isinstance(member, DelayedReplicationDescriptor):
                     ret.append(member.factor.id)
-                members = member.members + members
+                members.extend(reversed(member.members))
 
-        return ret
+        return tuple(ret)
 
 
 class UndefinedDescriptor(Descriptor):
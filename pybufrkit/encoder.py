@@ -9,7 +9,6 @@ from __future__ import print_function
 import functools
 import json
 import logging
-import six
 
 from pybufrkit.constants import (BITPOS_START,
                                  NBITS_FOR_NBITS_DIFF,
@@ -59,7 +58,8 @@ class Encoder(Coder):
                  ignore_declared_length=True,
                  compiled_template_cache_max=None,
                  master_table_number=None,
-                 master_table_version=None):
+                 master_table_version=None,
+                 compiled_template_use_python_func=True):
 
         super(Encoder, self).__init__(definitions_dir, tables_root_dir)
         self.ignore_declared_length = ignore_declared_length
@@ -71,7 +71,8 @@ class Encoder(Coder):
 
         # Only enable template compilation if cache is requested
         if compiled_template_cache_max is not None:
-            self.compiled_template_manager = CompiledTemplateManager(compiled_template_cache_max)
+            self.compiled_template_manager = CompiledTemplateManager(
+                compiled_template_cache_max, use_python_func=compiled_template_use_python_func)
             log.debug('Template compilation enabled with cache size of {}'.format(compiled_template_cache_max))
         else:
             self.compiled_template_manager = None
@@ -89,9 +90,9 @@ class Encoder(Coder):
         :return: A bitstring object of the encoded message.
         """
 
-        if isinstance(s, (six.binary_type, six.text_type)):
+        if isinstance(s, (bytes, str)):
             # TODO: ensure all strings are loaded as plain ascii instead of unicode from JSON
-            json_data = json.loads(s) if six.PY3 else json.loads(s, encoding='latin-1')
+            json_data = json.loads(s)
         else:
             json_data = s
 
@@ -149,7 +150,7 @@ class Encoder(Coder):
             else:
                 bit_writer.write(parameter.value, parameter.type, parameter.nbits)
 
-            log.debug('{} = {!r}'.format(parameter.name, parameter.value))
+            log.debug('%s = %r', parameter.name, parameter.value)
 
             # Make available as a property of the overall message object
             if parameter.as_property:
@@ -221,7 +222,9 @@ class Encoder(Coder):
 
         if self.compiled_template_manager:
             template_to_process = self.compiled_template_manager.get_or_compile(bufr_template, table_group)
-            template_processing_func = functools.partial(process_compiled_template, self)
+            template_processing_func = functools.partial(
+                process_compiled_template, self,
+                use_python_func=self.compiled_template_manager.use_python_func)
         else:
             template_to_process = bufr_template
             template_processing_func = self.process_template
@@ -28,6 +28,12 @@ class BitReadError(PyBufrKitError):
     """
 
 
+class BitWriteError(PyBufrKitError):
+    """
+    Bit writing error
+    """
+
+
 class PathExprParsingError(PyBufrKitError):
     """
     Error on parsing a Path expression
@@ -7,14 +7,10 @@ from __future__ import absolute_import
 from __future__ import print_function
 
 import abc
-from collections import OrderedDict
-
-# noinspection PyUnresolvedReferences
-from six.moves import range, zip
 
 from pybufrkit.constants import INDENT_CHARS, PARAMETER_TYPE_TEMPLATE_DATA
 from pybufrkit.errors import PyBufrKitError
-from pybufrkit.utils import fixed_width_repr_of_int
+from pybufrkit.utils import fixed_width_repr_of_int, flag_bits_of_int
 from pybufrkit.bufr import BufrMessage
 from pybufrkit.descriptors import (Descriptor, ElementDescriptor, FixedReplicationDescriptor,
                                    DelayedReplicationDescriptor, OperatorDescriptor,
@@ -91,31 +87,44 @@ class FlatTextRenderer(Renderer):
         Format the template data so that they have an user-friend display.
         """
         ret = []
+        # The rendered descriptor and the number of bits of a flag table (zero
+        # for other descriptors) keyed by id of the descriptor. Subsets mostly
+        # share the same descriptors, so each one is only rendered once.
+        descriptor_infos = {}
+        # Flag table values tend to repeat across subsets, so are their bits
+        flag_bits = {}
         for idx_subset in range(template_data.n_subsets):
             ret.append('###### subset {} of {} ######'.format(idx_subset + 1, template_data.n_subsets))
             descriptors = template_data.decoded_descriptors_all_subsets[idx_subset]
             bitmap_links = template_data.bitmap_links_all_subsets[idx_subset]
             values = template_data.decoded_values_all_subsets[idx_subset]
             for idx, (descriptor, value) in enumerate(zip(descriptors, values)):
-                if value is not None and hasattr(descriptor, 'unit') and descriptor.unit == 'FLAG TABLE':
-                    value = (
-                        value,
-                        [(i + 1) for i, bit in enumerate(
-                            '{:0{}b}'.format(value, descriptor.nbits)
-                        ) if bit == '1']
+                descriptor_info = descriptor_infos.get(id(descriptor))
+                if descriptor_info is None:
+                    descriptor_info = descriptor_infos[id(descriptor)] = (
+                        self._render_descriptor(descriptor),
+                        descriptor.nbits if getattr(descriptor, 'unit', None) == 'FLAG TABLE' else 0
                     )
+                rendered_descriptor, nbits_flag = descriptor_info
+
+                if value is not None and nbits_flag:
+                    bits = flag_bits.get((value, nbits_flag))
+                    if bits is None:
+                        bits = flag_bits[(value, nbits_flag)] = flag_bits_of_int(value, nbits_flag)
+                    value = (value, bits)
 
-                if idx in bitmap_links:
+                idx_bitmapped = bitmap_links.get(idx)
+                if idx_bitmapped is not None:
                     ret.append('{} {:64.64} -> {} {!r}'.format(
                         fixed_width_repr_of_int(idx + 1, 5),
-                        self._render_descriptor(descriptor),
-                        fixed_width_repr_of_int(bitmap_links[idx] + 1, 6, pad_left=False),
+                        rendered_descriptor,
+                        fixed_width_repr_of_int(idx_bitmapped + 1, 6, pad_left=False),
                         value)
                     )
                 else:
                     ret.append('{} {:74.74} {!r}'.format(
                         fixed_width_repr_of_int(idx + 1, 5),
-                        self._render_descriptor(descriptor),
+                        rendered_descriptor,
                         value)
                     )
         return '\n'.join(ret)
@@ -202,7 +211,7 @@ class FlatJsonRenderer(Renderer):
         raise NotImplementedError()
 
     def _render_query_result(self, query_result):
-        ret = OrderedDict()
+        ret = {}
         for idx_subset in query_result.subset_indices():
             ret[idx_subset] = query_result.get_values(idx_subset, flat=True)
         return ret
@@ -242,7 +251,7 @@ class NestedJsonRenderer(Renderer):
         return ret
 
     def _render_query_result(self, query_result):
-        ret = OrderedDict()
+        ret = {}
         for idx_subset in query_result.subset_indices():
             ret[idx_subset] = query_result.get_values(idx_subset)
         return ret
@@ -307,7 +316,7 @@ class NestedJsonRenderer(Renderer):
         ret = {'id': str(descriptor), 'description': description, 'value': value}
         if is_attribute and not isinstance(descriptor, AssociatedDescriptor):
             ret['virtual'] = True
-        if hasattr(decoded_node, 'attributes'):
+        if getattr(decoded_node, 'attributes', None):
             ret['attributes'] = self._render_template_data_attributed_node(
                 decoded_node, decoded_descriptors, decoded_values
             )
@@ -440,7 +449,7 @@ class NestedTextRenderer(Renderer):
                 value
             )
         ]
-        if hasattr(decoded_node, 'attributes'):
+        if getattr(decoded_node, 'attributes', None):
             ret.extend(
                 self._render_template_data_attributed_node(
                     decoded_node, decoded_descriptors, decoded_values, indent + INDENT_CHARS
@@ -7,6 +7,7 @@ from __future__ import print_function
 
 import functools
 import ast
+import re
 
 from pybufrkit.dataquery import QueryResult
 from pybufrkit.query import BufrMessageQuerent
@@ -19,6 +20,9 @@ STATE_SINGLE_QUOTE = "'"
 STATE_DOUBLE_QUOTE = '"'
 STATE_COMMENT = '#'
 
+# Characters that may change the state when not in any quote, comment or query
+_IDLE_SPECIAL_CHARS = re.compile('[\'"$#]')
+
 
 def process_embedded_query_expr(input_string):
     """
@@ -36,7 +40,29 @@ def process_embedded_query_expr(input_string):
     substitutions = {}  # keyed by query expression
 
     query_expr = []
-    while idx_char < len(input_string):
+    len_input_string = len(input_string)
+    while idx_char < len_input_string:
+        # Only the next character that may change the current state needs to be
+        # looked at. Everything before it is copied as is in a single slice.
+        if state == STATE_IDLE:
+            match = _IDLE_SPECIAL_CHARS.search(input_string, idx_char)
+            idx_special = match.start() if match else len_input_string
+        else:
+            if state == STATE_EMBEDDED_QUERY:
+                terminator = '}'
+            elif state == STATE_COMMENT:
+                terminator = '\n'
+            else:  # the closing quote
+                terminator = state
+            idx_special = input_string.find(terminator, idx_char)
+            if idx_special == -1:
+                idx_special = len_input_string
+
+        if idx_special > idx_char:
+            (query_expr if state == STATE_EMBEDDED_QUERY else keep).append(input_string[idx_char:idx_special])
+            idx_char = idx_special
+            continue
+
         c = input_string[idx_char]
 
         if state == STATE_EMBEDDED_QUERY:
@@ -62,7 +88,7 @@ def process_embedded_query_expr(input_string):
             keep.append(c)
 
         elif c == '$' and state == STATE_IDLE:  # an unquoted $
-            if idx_char + 1 < len(input_string) and input_string[idx_char + 1] == '{':
+            if idx_char + 1 < len_input_string and input_string[idx_char + 1] == '{':
                 state = STATE_EMBEDDED_QUERY
                 # Once it enters the embedded query state, any pond,
                 # double/single quotes will be ignored
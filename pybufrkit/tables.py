@@ -26,12 +26,8 @@ from __future__ import absolute_import
 import os
 import json
 import logging
-import functools
 from numbers import Integral
-from collections import namedtuple
-
-# noinspection PyUnresolvedReferences
-from six.moves import range
+from collections import namedtuple, OrderedDict
 
 from pybufrkit.constants import DEFAULT_TABLES_DIR
 from pybufrkit.descriptors import (ElementDescriptor,
@@ -270,7 +266,7 @@ class TableR(BaseTable):
 
 def _descriptors_from_ids(b, c, r, d, ids):
     g = (id_ if isinstance(id_, Integral) else int(id_) for id_ in ids)
-    return _descriptors_from_ids_iter(b, c, r, d, functools.partial(next, g))
+    return _descriptors_from_ids_iter(b, c, r, d, g.__next__)
 
 
 def _descriptors_from_ids_iter(b, c, r, d, next_id):
@@ -295,7 +291,7 @@ def _descriptors_from_ids_iter(b, c, r, d, next_id):
 
             g = generate_quiet(range(descriptor.n_items), next_id)
             # TODO: check whether the actual number of members equals to n_items
-            descriptor.members = _descriptors_from_ids_iter(b, c, r, d, functools.partial(next, g))
+            descriptor.members = _descriptors_from_ids_iter(b, c, r, d, g.__next__)
             descriptors.append(descriptor)
 
         else:  # element descriptor
@@ -569,3 +565,36 @@ class TableGroupCacheManager(object):
 
         # TODO: catch error on file reading?
         return TableGroupCacheManager.get_table_group_by_key(table_group_key)
+
+
+# Templates keyed by table group key and template IDs
+_templates = OrderedDict()
+TEMPLATES_CACHE_MAX = 128
+
+
+def template_from_ids(table_group, template_ids):
+    """
+    Build the BUFR template of the given IDs with the table group. Templates are
+    cached as messages of the same feed and compiled templates loaded together
+    tend to share them. The returned template is hence shared and must not be
+    mutated.
+
+    :param BufrTableGroup table_group:
+    :param tuple template_ids:
+    """
+    key = (table_group.key, template_ids, bool(TableGroupCacheManager.has_extra_entries()))
+    # The cache is shared by all coders. Pop and re-insert the entry to mark it
+    # as most recently used, instead of move_to_end, which raises KeyError if
+    # another thread evicts the key in between.
+    cached = _templates.pop(key, None)
+    # The table group must be the same object, i.e. not re-created after the
+    # table group cache is invalidated.
+    if cached is not None and cached[0] is table_group:
+        _templates[key] = cached
+        return cached[1]
+
+    template = table_group.template_from_ids(*template_ids)
+    _templates[key] = (table_group, template)
+    if len(_templates) > TEMPLATES_CACHE_MAX:
+        _templates.popitem(last=False)
+    return template
@@ -7,16 +7,22 @@ from __future__ import absolute_import
 from __future__ import print_function
 
 import sys
-import json
 import logging
 import contextlib
+from collections import OrderedDict
+
+try:  # orjson is optional. It parses large compiled templates much faster.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from pybufrkit.errors import PyBufrKitError
 from pybufrkit.coder import Coder, CoderState
-from pybufrkit.tables import TableGroupKey, TableGroupCacheManager
+from pybufrkit.tables import TableGroupKey, TableGroupCacheManager, template_from_ids
 from pybufrkit.descriptors import Descriptor
 
-__all__ = ['loads_compiled_template', 'TemplateCompiler', 'CompiledTemplateManager', 'process_compiled_template']
+__all__ = ['loads_compiled_template', 'TemplateCompiler', 'CompiledTemplateManager', 'compile_template',
+           'process_compiled_template', 'dumps_compiled_template_py', 'loads_compiled_template_py']
 
 log = logging.getLogger(__file__)
 
@@ -35,6 +41,9 @@ class Statement(object):
     """
     A basic code construct.
     """
+    # Slots keep the memory footprint small as a compiled template can have
+    # many thousands of statements.
+    __slots__ = ()
 
     def to_dict(self):
         return {'type': self.__class__.__name__}
@@ -44,6 +53,7 @@ class State031031Increment(Statement):
     """
     Add one to the 031031 count, n_031031 of the state object.
     """
+    __slots__ = ()
 
     def __str__(self):
         return 'n_031031 + 1'
@@ -53,20 +63,31 @@ class State031031Reset(Statement):
     """
     Reset the 031031 count, n_031031 of the state object, to zero.
     """
+    __slots__ = ()
 
     def __str__(self):
         return 'n_031031 = 0'
 
 
+# The 031031 count statements carry no arguments and are therefore stateless.
+# A single instance of each is shared by all compiled templates.
+STATE_031031_INCREMENT = State031031Increment()
+STATE_031031_RESET = State031031Reset()
+
+
 class MethodCall(Statement):
     """
     A generic method call
     """
+    __slots__ = ('method_name', 'args', 'state_properties', 'with_descriptor')
 
     def __init__(self, method_name, args=(), state_properties=None):
         self.method_name = method_name
         self.args = args
         self.state_properties = state_properties
+        # Whether the first argument is a descriptor is fixed once the call is
+        # recorded. Work it out here instead of on every execution of the call.
+        self.with_descriptor = len(args) > 0 and isinstance(args[0], Descriptor)
 
     def __str__(self):
         return '{}({})'.format(
@@ -81,7 +102,7 @@ class MethodCall(Statement):
             'args': self.args,
             'state_properties': self.state_properties,
         })
-        if len(self.args) > 0 and isinstance(self.args[0], Descriptor):
+        if self.with_descriptor:
             d['args'] = (self.args[0].id,) + self.args[1:]
             d['with_descriptor'] = True
         else:
@@ -95,6 +116,7 @@ class StateMethodCall(MethodCall):
     """
     A State object method call.
     """
+    __slots__ = ()
 
     def __str__(self):
         return 'state.{}'.format(super(StateMethodCall, self).__str__())
@@ -104,6 +126,7 @@ class CoderMethodCall(MethodCall):
     """
     A Coder object method call.
     """
+    __slots__ = ()
 
     def __str__(self):
         return 'coder.{}'.format(super(CoderMethodCall, self).__str__())
@@ -113,6 +136,7 @@ class Block(Statement):
     """
     A Block is a list of Statement
     """
+    __slots__ = ('statements',)
 
     def __init__(self):
         self.statements = []
@@ -137,10 +161,14 @@ class Loop(Block):
     execute within the loop. The loop variable can be either a constant
     or a function call that returns the actual value for the loop counter.
     """
+    __slots__ = ('repeat', 'repeat_method_name')
 
     def __init__(self, repeat):
         super(Loop, self).__init__()
         self.repeat = repeat
+        # Name of the coder method that gives the loop counter at runtime.
+        # None if the loop counter is a constant.
+        self.repeat_method_name = repeat.method_name if isinstance(repeat, CoderMethodCall) else None
 
     def __str__(self):
         return '<{}, {}>'.format(self.repeat, super(Loop, self).__str__())
@@ -159,11 +187,36 @@ class CompiledTemplate(Block):
 
     :param descriptors.BufrTemplate template: The template to compile
     """
+    __slots__ = ('table_group_key', 'template', '_python_func', '_python_func_compiled')
 
     def __init__(self, table_group_key, template):
         super(CompiledTemplate, self).__init__()
         self.table_group_key = table_group_key
         self.template = template
+        self._python_func = None
+        self._python_func_compiled = False
+
+    @property
+    def python_func(self):
+        """
+        The statements of the compiled template as a generated Python function.
+        It is created on first access and then kept with the compiled template.
+        None if the statements cannot be compiled into a Python function, in
+        which case the statements must be interpreted.
+        """
+        if not self._python_func_compiled:
+            self._python_func = compile_to_python_func(self)
+            self._python_func_compiled = True
+        return self._python_func
+
+    @python_func.setter
+    def python_func(self, python_func):
+        """
+        Use the given function, e.g. one loaded by loads_compiled_template_py,
+        instead of generating it. Setting None makes the statements interpreted.
+        """
+        self._python_func = python_func
+        self._python_func_compiled = True
 
     def to_dict(self):
         d = super(CompiledTemplate, self).to_dict()
@@ -185,6 +238,8 @@ class CompilerState(CoderState):
     def __init__(self, table_group, template):
         super(CompilerState, self).__init__(False, 1)
         self.block_stack = [CompiledTemplate(table_group.key, template)]
+        # Identical coder method calls are shared, keyed by their method name and arguments
+        self.coder_method_calls = {}
 
     @property
     def compiled_template(self):
@@ -200,8 +255,29 @@ class CompilerState(CoderState):
         self.block_stack.pop()
 
     def add_statement(self, statement):
+        if type(statement) is CoderMethodCall and statement.state_properties is None:
+            statement = self.intern_coder_method_call(statement)
         self.block_stack[-1].add_statement(statement)
 
+    def intern_coder_method_call(self, statement):
+        """
+        Return the previously recorded call that is identical to the given one if
+        it exists. Otherwise record and return the given call. Statements are
+        never modified once compiled, so a single instance can be shared by all
+        identical calls, e.g. the same descriptor in different replications.
+        """
+        args = statement.args
+        if statement.with_descriptor:
+            # Descriptors are compared by identity. Types are part of the key so
+            # that, e.g. a refval of 0 and 0.0, are not mixed up.
+            key = (statement.method_name, id(args[0])) + tuple((type(x), x) for x in args[1:])
+        else:
+            key = (statement.method_name,) + tuple((type(x), x) for x in args)
+        try:
+            return self.coder_method_calls.setdefault(key, statement)
+        except TypeError:  # unhashable arguments cannot be shared
+            return statement
+
     def mark_back_reference_boundary(self):
         self.add_statement(StateMethodCall(get_func_name()))
 
@@ -218,6 +294,10 @@ class CompilerState(CoderState):
         self.add_statement(StateMethodCall(get_func_name()))
 
 
+# Fixed replications of no more than this number of repeats are unrolled
+FIXED_REPLICATION_UNROLL_MAX = 4
+
+
 class TemplateCompiler(Coder):
     """
     The compiler for the BUFR Template. This class does its job by recording
@@ -247,17 +327,22 @@ class TemplateCompiler(Coder):
         n_031031 = state.n_031031
         super(TemplateCompiler, self).process_bitmap_definition(state, bit_operator, descriptor)
         if state.n_031031 == 0:
-            state.add_statement(State031031Reset())
+            state.add_statement(STATE_031031_RESET)
         elif state.n_031031 == n_031031 + 1:
-            state.add_statement(State031031Increment())
+            state.add_statement(STATE_031031_INCREMENT)
         elif state.n_031031 == n_031031:
             pass
         else:
             raise PyBufrKitError('erroneous n_031031 change')
 
     def process_fixed_replication_descriptor(self, state, bit_operator, descriptor):
-        with state.new_loop(descriptor.n_repeats):
-            self.process_members(state, bit_operator, descriptor.members)
+        # Small replications are unrolled to save the loop overhead at runtime.
+        # This simply falls back to the generic processing of the Coder.
+        if descriptor.n_repeats <= FIXED_REPLICATION_UNROLL_MAX:
+            super(TemplateCompiler, self).process_fixed_replication_descriptor(state, bit_operator, descriptor)
+        else:
+            with state.new_loop(descriptor.n_repeats):
+                self.process_members(state, bit_operator, descriptor.members)
 
     def process_delayed_replication_descriptor(self, state, bit_operator, descriptor):
         # TODO: delayed repetition descriptor 031011, 031012
@@ -313,61 +398,339 @@ class TemplateCompiler(Coder):
         state.add_statement(CoderMethodCall(get_func_name(), (descriptor, value)))
 
 
+def compile_template(template, table_group):
+    """
+    Compile the given template with a compiler local to this call. No compiler
+    state is shared between calls so templates can be compiled concurrently.
+    Long lived users, e.g. CompiledTemplateManager, keep their own compiler
+    instead to avoid re-reading the section definition files for every run.
+
+    :param descriptors.BufrTemplate template: The BUFR template to compile
+    :param tables.TableGroup table_group: The Table Group used to instantiate the Template.
+    :return: CompiledTemplate
+    """
+    return TemplateCompiler().process(template, table_group)
+
+
+#############################################################################
+# Generate Python code from a compiled template.
+class PythonSourceBuilder(object):
+    """
+    Build Python source code of a function that runs the statements of a
+    compiled template directly, i.e. without interpreting the statement objects.
+
+    Descriptors and any arguments that cannot be written as literals are
+    referenced by their positions in the descriptors and constants tuples,
+    which are bound to the function as default arguments.
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.descriptors = []
+        self.constants = []
+        self._idx_descriptors = {}  # keyed by id of descriptor
+        self.coder_method_names = []
+        # State properties whose values are known at the current point of the
+        # generated code. Assignments of unchanged values are skipped.
+        self.known_state_properties = {}
+
+    def add_line(self, depth, line):
+        self.lines.append('    ' * depth + line)
+
+    def ref_descriptor(self, descriptor):
+        idx = self._idx_descriptors.get(id(descriptor))
+        if idx is None:
+            idx = self._idx_descriptors[id(descriptor)] = len(self.descriptors)
+            self.descriptors.append(descriptor)
+        return 'D[{}]'.format(idx)
+
+    def ref_value(self, value):
+        value_type = type(value)
+        if value is None or value_type is bool or value_type is int:
+            return repr(value)
+        if value_type is float and value == value and value not in (float('inf'), float('-inf')):
+            return repr(value)
+        self.constants.append(value)
+        return 'C[{}]'.format(len(self.constants) - 1)
+
+    def ref_coder_method(self, method_name):
+        # Coder methods are bound to local variables once at the start of the function
+        if method_name not in self.coder_method_names:
+            self.coder_method_names.append(method_name)
+        return 'coder_{}'.format(method_name)
+
+    def add_statements(self, depth, statements):
+        if not statements:
+            self.add_line(depth, 'pass')
+
+        for statement in statements:
+            if isinstance(statement, MethodCall):
+                if statement.state_properties is not None:
+                    for k, v in statement.state_properties.items():
+                        if k in self.known_state_properties:
+                            known_value = self.known_state_properties[k]
+                            if type(known_value) is type(v) and known_value == v:
+                                continue
+                        self.add_line(depth, 'state.{} = {}'.format(k, self.ref_value(v)))
+                        self.known_state_properties[k] = v
+
+                if type(statement) is StateMethodCall:
+                    self.add_line(depth, 'state.{}({})'.format(
+                        statement.method_name, ', '.join(self.ref_value(x) for x in statement.args)))
+
+                elif type(statement) is CoderMethodCall:
+                    args = ['state']
+                    if statement.with_descriptor:
+                        args.append('bit_operator')
+                        args.append(self.ref_descriptor(statement.args[0]))
+                        args.extend(self.ref_value(x) for x in statement.args[1:])
+                    else:
+                        args.extend(self.ref_value(x) for x in statement.args)
+                    self.add_line(depth, '{}({})'.format(
+                        self.ref_coder_method(statement.method_name), ', '.join(args)))
+
+                else:
+                    raise PyBufrKitError('Unknown statement: {}'.format(statement))
+
+            elif isinstance(statement, State031031Reset):
+                self.add_line(depth, 'state.n_031031 = 0')
+
+            elif isinstance(statement, State031031Increment):
+                self.add_line(depth, 'state.n_031031 += 1')
+
+            elif type(statement) is Loop:
+                if statement.repeat_method_name is None:
+                    repeat = self.ref_value(statement.repeat)
+                else:
+                    repeat = '{}(state)'.format(self.ref_coder_method(statement.repeat_method_name))
+                self.add_line(depth, 'for _ in range({}):'.format(repeat))
+                # Values set in the previous pass of the loop may differ from those
+                # before the loop. So nothing is known at the start of the loop
+                # body and at the end of the loop.
+                self.known_state_properties = {}
+                self.add_statements(depth + 1, statement.statements)
+                self.known_state_properties = {}
+
+            else:
+                raise PyBufrKitError('Unknown statement: {}'.format(statement))
+
+    def build(self, compiled_template):
+        """
+        Build the source of the function for the given compiled template.
+
+        :param CompiledTemplate compiled_template:
+        :return: The source code of a function named run.
+        """
+        self.add_statements(1, compiled_template.statements)
+        body_lines = self.lines
+        self.lines = []
+        self.add_line(0, 'def run(coder_methods, state, bit_operator, D=D, C=C):')
+        for method_name in self.coder_method_names:
+            self.add_line(1, '{} = coder_methods[{!r}]'.format(self.ref_coder_method(method_name), method_name))
+        self.lines.extend(body_lines)
+        return '\n'.join(self.lines) + '\n'
+
+    def build_module(self, compiled_template):
+        """
+        Build the source of a Python module for the given compiled template. The
+        module looks up the descriptors from the table group when it is loaded
+        and defines the function named run.
+
+        :param CompiledTemplate compiled_template:
+        :return: The source code of the module.
+        """
+        func_source = self.build(compiled_template)
+        header_lines = [
+            '"""',
+            'Compiled template generated by pybufrkit',
+            '"""',
+            'from math import inf, nan',
+            'from pybufrkit.coder import BSRModifier',
+            'from pybufrkit.tables import TableGroupKey, TableGroupCacheManager',
+            '',
+            'TABLE_GROUP_KEY = {!r}'.format(compiled_template.table_group_key),
+            'TEMPLATE_IDS = {!r}'.format(compiled_template.template.original_descriptor_ids),
+            'TABLE_GROUP = TableGroupCacheManager.get_table_group_by_key(TABLE_GROUP_KEY)',
+            'D = tuple(TABLE_GROUP.lookup(x) for x in {!r})'.format(tuple(d.id for d in self.descriptors)),
+            'C = {!r}'.format(tuple(self.constants)),
+            '',
+            '',
+        ]
+        return '\n'.join(header_lines) + '\n' + func_source
+
+
+def compile_to_python_func(compiled_template):
+    """
+    Compile the given compiled template into a Python function that takes
+    the arguments of (coder_methods, state, bit_operator). The coder_methods
+    is a BoundMethods of the coder.
+
+    :param CompiledTemplate compiled_template:
+    :return: The function or None if the template is too deeply nested or
+        too large to be compiled by Python.
+    """
+    builder = PythonSourceBuilder()
+    source = builder.build(compiled_template)
+    namespace = {'D': tuple(builder.descriptors), 'C': tuple(builder.constants)}
+    try:
+        code = compile(source, '<compiled template>', 'exec')
+    except (SyntaxError, RecursionError, MemoryError) as e:
+        log.debug('Cannot compile template to Python function: {}'.format(e))
+        return None
+    exec(code, namespace)
+    return namespace['run']
+
+
 # #############################################################################
 # Functions to execute a compiled template.
-def process_compiled_template(coder, state, bit_operator, compiled_template):
+class BoundMethods(dict):
+    """
+    A lookup of bound methods of the given object keyed by method name. Each
+    method is resolved with getattr only once and then served from the dict.
+    This saves the attribute lookup and bound method creation for every
+    execution of a compiled call, which adds up inside replication loops.
+
+    When a suffix is given, a method named with the suffix appended is preferred
+    over the plain one if the object has it. This allows a call to, e.g.
+    process_numeric, be bound directly to process_numeric_compressed.
+
+    :param obj: The object whose methods are looked up.
+    :param suffix: Optional suffix of the preferred specialised methods.
+    """
+
+    def __init__(self, obj, suffix=None):
+        super(BoundMethods, self).__init__()
+        self.obj = obj
+        self.suffix = suffix
+
+    def __missing__(self, method_name):
+        method = None
+        if self.suffix is not None:
+            method = getattr(self.obj, method_name + self.suffix, None)
+        if method is None:
+            method = getattr(self.obj, method_name)
+        self[method_name] = method
+        return method
+
+
+def process_compiled_template(coder, state, bit_operator, compiled_template, use_python_func=True):
     """
-    This function runs the compiled code from the TemplateCompiler
+    This function runs the compiled code from the TemplateCompiler. The
+    generated Python function of the compiled template is used if available.
+    Otherwise the statements are interpreted.
 
     :param Coder coder:
     :param VmState state:
     :param bit_operator:
     :param Block compiled_template:
+    :param use_python_func: If False, always interpret the statements without
+        generating the Python function.
     """
-    process_statements(coder, state, bit_operator, compiled_template.statements)
+    python_func = compiled_template.python_func if use_python_func else None
+    if python_func is not None:
+        process_python_func(coder, state, bit_operator, python_func)
+    else:
+        process_statements(coder, state, bit_operator, compiled_template.statements,
+                           bound_coder_methods(coder, state), BoundMethods(state))
 
 
-def process_statements(coder, state, bit_operator, statements):
+def bound_coder_methods(coder, state):
     """
-    Process through a list of statements. Recursively call itself if the sub-statement
-    is itself a list of statements.
+    Get the BoundMethods of the coder for running a compiled template.
     """
-    for statement in statements:
-        if isinstance(statement, MethodCall):
-            # Populate any necessary state properties. This is to re-create the
-            # modifier effects of operator descriptors.
-            if statement.state_properties is not None:
-                for k, v in statement.state_properties.items():
-                    setattr(state, k, v)
+    # Whether the data is compressed does not change within a run. Calls are
+    # hence bound straight to the compressed or uncompressed variants of the
+    # coder methods, e.g. Decoder.process_numeric_compressed, to skip the
+    # dispatch the generic methods would otherwise do on every call.
+    return BoundMethods(coder, '_compressed' if state.is_compressed else '_uncompressed')
+
 
-            if type(statement) is StateMethodCall:
-                getattr(state, statement.method_name)(*statement.args)
+def process_python_func(coder, state, bit_operator, python_func):
+    """
+    Run the generated Python function of a compiled template, e.g. the
+    python_func of a CompiledTemplate or one loaded by loads_compiled_template_py.
 
-            elif type(statement) is CoderMethodCall:
-                if issubclass(type(statement.args[0]), Descriptor):
-                    getattr(coder, statement.method_name)(state, bit_operator, *statement.args)
+    :param Coder coder:
+    :param state:
+    :param bit_operator:
+    :param python_func: The generated Python function
+    """
+    python_func(bound_coder_methods(coder, state), state, bit_operator)
+
+
+def process_statements(coder, state, bit_operator, statements,
+                       coder_methods=None, state_methods=None):
+    """
+    Process through a list of statements. Statements of loops are processed
+    with an explicit stack instead of recursion so that deeply nested loops
+    cost neither extra Python frames nor recursion depth.
+
+    :param coder_methods: Optional BoundMethods of the coder to share across calls.
+    :param state_methods: Optional BoundMethods of the state to share across calls.
+    """
+    if coder_methods is None:
+        coder_methods = BoundMethods(coder)
+    if state_methods is None:
+        state_methods = BoundMethods(state)
+
+    state_dict = vars(state)
+    last_state_properties = None
+    # Each entry is the list of statements being processed, the iterator of the
+    # current pass through them and the number of passes still to go after it.
+    stack = [[statements, iter(statements), 0]]
+    while stack:
+        entry = stack[-1]
+        for statement in entry[1]:
+            # Exact type checks are used as they are cheaper than isinstance. The
+            # checks are ordered by how frequent the statements are.
+            statement_type = type(statement)
+            if statement_type is CoderMethodCall or statement_type is StateMethodCall:
+                # Populate any necessary state properties. This is to re-create the
+                # modifier effects of operator descriptors. They are all plain
+                # attributes of the state and hence set with a single update.
+                # Nothing else changes these properties when running a compiled
+                # template. So they need not be set again if they were the last
+                # ones applied, e.g. a bitmapped descriptor inside a loop.
+                state_properties = statement.state_properties
+                if state_properties is not None and state_properties is not last_state_properties:
+                    state_dict.update(state_properties)
+                    last_state_properties = state_properties
+
+                if statement_type is CoderMethodCall:
+                    if statement.with_descriptor:
+                        coder_methods[statement.method_name](state, bit_operator, *statement.args)
+                    else:
+                        coder_methods[statement.method_name](state, *statement.args)
                 else:
-                    getattr(coder, statement.method_name)(state, *statement.args)
-            else:
-                raise PyBufrKitError('Unknown statement: {}'.format(statement))
+                    state_methods[statement.method_name](*statement.args)
 
-        elif isinstance(statement, State031031Reset):
-            state.n_031031 = 0
+            elif statement_type is State031031Increment:
+                state.n_031031 += 1
 
-        elif isinstance(statement, State031031Increment):
-            state.n_031031 += 1
+            elif statement_type is State031031Reset:
+                state.n_031031 = 0
 
-        elif type(statement) is Loop:
-            if isinstance(statement.repeat, CoderMethodCall):
-                repeat = getattr(coder, statement.repeat.method_name)(state)
-            else:
-                repeat = statement.repeat
+            elif statement_type is Loop:
+                if statement.repeat_method_name is None:
+                    repeat = statement.repeat
+                else:
+                    repeat = coder_methods[statement.repeat_method_name](state)
 
-            for _ in range(repeat):
-                process_statements(coder, state, bit_operator, statement.statements)
+                if repeat > 0:
+                    # Continue with the loop statements. The current list resumes
+                    # from its iterator once the loop is done.
+                    stack.append([statement.statements, iter(statement.statements), repeat - 1])
+                    break
 
-        else:
-            raise PyBufrKitError('Unknown statement: {}'.format(statement))
+            else:
+                raise PyBufrKitError('Unknown statement: {}'.format(statement))
+
+        else:  # The current pass is exhausted
+            if entry[2] > 0:
+                entry[2] -= 1
+                entry[1] = iter(entry[0])
+            else:
+                stack.pop()
 
 
 #############################################################################
@@ -375,14 +738,18 @@ def process_statements(coder, state, bit_operator, statements):
 class CompiledTemplateManager(object):
     """
     A management class for compiled templates that handles caching and lookup.
+    The least recently used compiled template is evicted when the cache is full.
 
     :param cache_max: The maximum number of compiled templates to cache.
+    :param use_python_func: Whether compiled templates are run as generated
+        Python functions. If False, their statements are always interpreted.
     """
 
-    def __init__(self, cache_max):
+    def __init__(self, cache_max, use_python_func=True):
         self.template_compiler = TemplateCompiler()
         self.cache_max = cache_max
-        self.cache = {}
+        self.use_python_func = use_python_func
+        self.cache = OrderedDict()
 
     def get_or_compile(self, template, table_group):
         """
@@ -391,11 +758,8 @@ class CompiledTemplateManager(object):
         :param tables.TableGroup table_group: The Table Group used to instantiate the Template.
         :return:
         """
-        key_of_compiled_template = (
-            tuple(template.original_descriptor_ids),
-            table_group.key
-        )
-        log.debug('Getting compiled template of key: {}'.format(key_of_compiled_template))
+        key_of_compiled_template = (template.original_descriptor_ids_key, table_group.key)
+        log.debug('Getting compiled template of key: %s', key_of_compiled_template)
         compiled_template = self.cache.get(key_of_compiled_template, None)
 
         if compiled_template is None:
@@ -403,14 +767,41 @@ class CompiledTemplateManager(object):
             compiled_template = self.template_compiler.process(template, table_group)
 
             if self.cache_max > 0:
-                # TODO: Better cache invalidate algorithm
                 if len(self.cache) >= self.cache_max:
-                    self.cache.popitem()
+                    self.cache.popitem(last=False)
 
                 self.cache[key_of_compiled_template] = compiled_template
+        else:
+            self.cache.move_to_end(key_of_compiled_template)
 
         return compiled_template
 
+    def warmup(self, templates_and_table_groups):
+        """
+        Compile the given templates ahead of time so that messages using them
+        later do not pay for the compilation. The Python functions of the
+        compiled templates are generated as well unless use_python_func is False.
+
+        Only up to cache_max compiled templates are kept. Warming up more than
+        that evicts the earlier ones, which are then compiled again when used.
+        A warning is logged in this case.
+
+        :param templates_and_table_groups: An iterable of pairs of BUFR template
+            and the table group used to instantiate it.
+        :return: The list of compiled templates
+        """
+        compiled_templates = []
+        for template, table_group in templates_and_table_groups:
+            compiled_template = self.get_or_compile(template, table_group)
+            # Accessing the Python function generates and keeps it with the compiled template
+            if self.use_python_func and compiled_template.python_func is None:
+                log.debug('Compiled template will be interpreted: %s', template.original_descriptor_ids_key)
+            compiled_templates.append(compiled_template)
+        if len(compiled_templates) > self.cache_max:
+            log.warning('Warmed up %s templates but only %s of them are kept in the cache',
+                        len(compiled_templates), self.cache_max)
+        return compiled_templates
+
 
 #############################################################################
 # Functions to Load a CompiledTemplate from a JSON String.
@@ -418,17 +809,18 @@ def loads_compiled_template(s):
     """
     Load a compiled template object from its JSON string representation.
 
-    :param s: A JSON string represents the compiled template.
+    :param s: A JSON string represents the compiled template. It is parsed with
+        orjson if installed, which also accepts bytes.
     :return: The compiled template
     """
-    d = json.loads(s)
+    d = json_loads(s)
     assert d['type'] == 'CompiledTemplate', 'The type must be CompiledTemplate (was {})'.format(d['type'])
     # Table group key and its elements must be tuple to be hashable, which is a
     # requirement for being a key to dict.
     table_group = TableGroupCacheManager.get_table_group_by_key(
         TableGroupKey(*[(tuple(x) if isinstance(x, list) else x) for x in d['table_group_key']])
     )
-    template = table_group.template_from_ids(*d['template_ids'])
+    template = template_from_ids(table_group, tuple(d['template_ids']))
     compiled_template = CompiledTemplate(table_group.key, template)
     for statement_dict in d['statements']:
         compiled_template.add_statement(
@@ -437,6 +829,32 @@ def loads_compiled_template(s):
     return compiled_template
 
 
+def dumps_compiled_template_py(compiled_template):
+    """
+    Dump the compiled template as the source of a Python module. This is an
+    alternative persistence format to JSON. Loading it needs neither parsing
+    JSON nor re-creating the statement objects.
+
+    :param CompiledTemplate compiled_template:
+    :return: The Python source code
+    """
+    return PythonSourceBuilder().build_module(compiled_template)
+
+
+def loads_compiled_template_py(s):
+    """
+    Load the generated Python function from the source dumped by
+    dumps_compiled_template_py. The function can be run with
+    process_python_func or set as the python_func of a CompiledTemplate.
+
+    :param str s: The Python source code of the compiled template.
+    :return: The generated Python function
+    """
+    namespace = {}
+    exec(compile(s, '<compiled template>', 'exec'), namespace)
+    return namespace['run']
+
+
 def load_loop_from_dict(table_group, d):
     assert d['type'] == 'Loop', 'The type must be Loop (was {})'.format(d['type'])
     if isinstance(d['repeat'], dict):
@@ -478,6 +896,6 @@ STATEMENT_LOAD_FUNCS = {
     'Loop': load_loop_from_dict,
     'CoderMethodCall': load_coder_method_call_from_dict,
     'StateMethodCall': load_state_method_call_from_dict,
-    'State031031Increment': lambda *args: State031031Increment(),
-    'State031031Reset': lambda *args: State031031Reset(),
+    'State031031Increment': lambda *args: STATE_031031_INCREMENT,
+    'State031031Reset': lambda *args: STATE_031031_RESET,
 }
@@ -10,12 +10,6 @@ allocated to their corresponding values.
 from __future__ import absolute_import
 from __future__ import print_function
 
-import itertools
-import functools
-
-# noinspection PyUnresolvedReferences
-from six.moves import range
-
 from pybufrkit.errors import PyBufrKitError
 from pybufrkit.descriptors import (ElementDescriptor,
                                    FixedReplicationDescriptor,
@@ -31,6 +25,7 @@ class DataNode(object):
     A node is composed of a descriptor and its value (if exists) and any
     possible child or attribute nodes.
     """
+    __slots__ = ('descriptor',)
 
     def __init__(self, descriptor):
         self.descriptor = descriptor
@@ -52,18 +47,24 @@ class NoValueDataNode(DataNode):
     replication descriptors, sequence descriptors and some operator descriptors,
     e.g. 201YYY.
     """
+    __slots__ = ()
+    HAS_VALUE = False
 
     def __init__(self, descriptor):
         super(NoValueDataNode, self).__init__(descriptor)
 
 
 class FixedReplicationNode(NoValueDataNode):
+    __slots__ = ('members',)
+
     def __init__(self, descriptor):
         super(FixedReplicationNode, self).__init__(descriptor)
         self.members = []
 
 
 class DelayedReplicationNode(NoValueDataNode):
+    __slots__ = ('members', 'factor')
+
     def __init__(self, descriptor):
         super(DelayedReplicationNode, self).__init__(descriptor)
         self.members = []
@@ -71,6 +72,8 @@ class DelayedReplicationNode(NoValueDataNode):
 
 
 class SequenceNode(NoValueDataNode):
+    __slots__ = ('members',)
+
     def __init__(self, descriptor):
         super(SequenceNode, self).__init__(descriptor)
         self.members = []
@@ -85,17 +88,20 @@ class ValueDataNode(DataNode):
     :param int index: The index to the descriptors and values array for getting the
                       descriptor and its associated value.
     """
+    __slots__ = ('index', 'attributes')
+    HAS_VALUE = True
 
     def __init__(self, descriptor, index):
         super(ValueDataNode, self).__init__(descriptor)
         self.index = index
+        self.attributes = None
 
     def __str__(self):
         return 'V{}'.format(self.index)
 
     def add_attribute(self, attr_node):
-        # Add attributes field only when it is necessary
-        if not hasattr(self, 'attributes'):
+        # Create the attributes list only when it is necessary
+        if self.attributes is None:
             self.attributes = [attr_node]
         else:
             self.attributes.append(attr_node)
@@ -103,27 +109,27 @@ class ValueDataNode(DataNode):
 
 # The following types of Node can be attributes
 class AssociatedFieldNode(ValueDataNode):
-    pass
+    __slots__ = ()
 
 
 class FirstOrderStatsNode(ValueDataNode):
-    pass
+    __slots__ = ()
 
 
 class DifferenceStatsNode(ValueDataNode):
-    pass
+    __slots__ = ()
 
 
 class SubstitutionNode(ValueDataNode):
-    pass
+    __slots__ = ()
 
 
 class ReplacementNode(ValueDataNode):
-    pass
+    __slots__ = ()
 
 
 class QualityInfoNode(ValueDataNode):
-    pass
+    __slots__ = ()
 
 
 # noinspection PyAttributeOutsideInit
@@ -177,44 +183,90 @@ class TemplateData(object):
         else:
             self._is_wired = True
 
+        self._prepare_wire_methods()
+
         # For compressed data, the wiring is the same for all subsets.
         n_subsets = 1 if self.is_compressed else self.n_subsets
 
         for idx_subset in range(n_subsets):
             self.decoded_nodes = self.decoded_nodes_all_subsets[idx_subset]
-            self.decoded_descriptors = self.decoded_descriptors_all_subsets[idx_subset]
-            self.decoded_values = self.decoded_values_all_subsets[idx_subset]
-            self.bitmap_links = self.bitmap_links_all_subsets[idx_subset]
-
-            # The index is used to index into the decoded descriptors/values.
-            # The is used to have links between flat indices and nested nodes,
-            # so that attributes can be associated to their bit-mapped nodes.
-            self.index_to_node = {}
-            self.next_index = functools.partial(next, itertools.count())
-            self.nbits_associated_list = []  # 204 YYY
-            self.data_not_present_count = 0  # 221
-            self.waiting_for_qa_info_meaning = False
-            self.waiting_for_1st_order_stats_meaning = False
-            self.waiting_for_difference_stats_meaning = False
-
-            self.wire_members(self.template.members)
-
-            # release memory
-            del self.index_to_node
+            self._wire_subset(idx_subset, self.decoded_nodes)
+
+    def iter_wired_subsets(self):
+        """
+        Generate the wired nodes of each subset as a tuple of the subset index
+        and the list of nodes. Unlike wire, the nodes of uncompressed subsets
+        are wired on demand and not kept by this object. Hence only nodes of
+        one subset need to be in memory at a time if the caller does not keep
+        them either.
+
+        If the data is already wired, the existing nodes are generated.
+        """
+        if self._is_wired:
+            for idx_subset, nodes in enumerate(self.decoded_nodes_all_subsets):
+                yield idx_subset, nodes
+            return
+
+        if self.is_compressed:  # the wiring is the same for all subsets
+            self.wire()
+            for idx_subset, nodes in enumerate(self.decoded_nodes_all_subsets):
+                yield idx_subset, nodes
+            return
+
+        self._prepare_wire_methods()
+        for idx_subset in range(self.n_subsets):
+            nodes = []
+            self._wire_subset(idx_subset, nodes)
+            yield idx_subset, nodes
+
+    def _prepare_wire_methods(self):
+        # Wire methods are dispatched by the exact type of the descriptor or the
+        # operator code to avoid walking through a chain of checks per member.
+        self.wire_methods = {}
+        self.operator_wire_methods = {
+            operator_code: getattr(self, method_name)
+            for operator_code, method_name in OPERATOR_WIRE_METHOD_NAMES.items()
+        }
+
+    def _wire_subset(self, idx_subset, nodes):
+        """
+        Wire the subset of the given index and add the top level nodes to the
+        given list.
+        """
+        self.decoded_descriptors = self.decoded_descriptors_all_subsets[idx_subset]
+        self.decoded_values = self.decoded_values_all_subsets[idx_subset]
+        self.bitmap_links = self.bitmap_links_all_subsets[idx_subset]
+
+        # The index is used to index into the decoded descriptors/values.
+        # The is used to have links between flat indices and nested nodes,
+        # so that attributes can be associated to their bit-mapped nodes.
+        self.index_to_node = {}
+        self.next_index = 0
+        self.nbits_associated_list = []  # 204 YYY
+        self.data_not_present_count = 0  # 221
+        self.waiting_for_qa_info_meaning = False
+        self.waiting_for_1st_order_stats_meaning = False
+        self.waiting_for_difference_stats_meaning = False
+
+        self.wire_members(self.template.members, nodes)
+
+        # release memory
+        del self.index_to_node
 
     def get_next_descriptor_and_index(self):
-        index = self.next_index()
+        index = self.next_index
+        self.next_index = index + 1
         return self.decoded_descriptors[index], index
 
-    def add_node(self, node):
-        self.decoded_nodes.append(node)
-        if not isinstance(node, NoValueDataNode):
+    def add_node(self, nodes, node):
+        nodes.append(node)
+        if node.HAS_VALUE:
             self.index_to_node[node.index] = node
         return node
 
-    def add_value_node(self):
+    def add_value_node(self, nodes):
         node = ValueDataNode(*self.get_next_descriptor_and_index())
-        self.decoded_nodes.append(node)
+        nodes.append(node)
         self.index_to_node[node.index] = node
         return node
 
@@ -223,193 +275,230 @@ class TemplateData(object):
         self.index_to_node[factor_node.index] = factor_node
         return factor_node
 
-    def wire_element_descriptor(self, descriptor):
+    def wire_element_descriptor(self, descriptor, nodes):
+        X = descriptor.X
+        nbits_associated_list = self.nbits_associated_list
         # Read associated field if exists
-        if self.nbits_associated_list and descriptor.X != 31:
+        if nbits_associated_list and X != 31:
             assoc_node = AssociatedFieldNode(*self.get_next_descriptor_and_index())
             assoc_node.add_attribute(self.associated_field_meaning)
             node = ValueDataNode(*self.get_next_descriptor_and_index())
             node.add_attribute(assoc_node)
-            self.add_node(node)
+            self.add_node(nodes, node)
 
         else:
-            if descriptor.X == 33 and self.waiting_for_qa_info_meaning:
-                node = self.add_node(QualityInfoNode(*self.get_next_descriptor_and_index()))
+            if X == 33 and self.waiting_for_qa_info_meaning:
+                node = self.add_node(nodes, QualityInfoNode(*self.get_next_descriptor_and_index()))
                 self.index_to_node[self.bitmap_links[node.index]].add_attribute(node)
 
             else:
-                node = self.add_value_node()
-                if descriptor.id == 31021 and self.nbits_associated_list:
+                node = self.add_value_node(nodes)
+                id_ = descriptor.id
+                if id_ == 31021 and nbits_associated_list:
                     self.associated_field_meaning = node
 
-                elif descriptor.id == 8023 and self.waiting_for_1st_order_stats_meaning:
+                elif id_ == 8023 and self.waiting_for_1st_order_stats_meaning:
                     self.first_order_stats_meaning = node
                     self.waiting_for_1st_order_stats_meaning = False
 
-                elif descriptor.id == 8024 and self.waiting_for_difference_stats_meaning:
+                elif id_ == 8024 and self.waiting_for_difference_stats_meaning:
                     self.difference_stats_meaning = node
                     self.waiting_for_difference_stats_meaning = False
 
-    def wire_fixed_replication_descriptor(self, descriptor):
+    def wire_fixed_replication_descriptor(self, descriptor, nodes):
         """
         :param FixedReplicationDescriptor descriptor:
+        :return: The nodes list, members and number of passes to wire the members
         """
-        fixed_replication_node = FixedReplicationNode(descriptor)
-        nodes = self.decoded_nodes
-        self.decoded_nodes = fixed_replication_node.members
-        for _ in range(descriptor.n_repeats):
-            self.wire_members(descriptor.members)
-        self.decoded_nodes = nodes
-
-        self.add_node(fixed_replication_node)
+        fixed_replication_node = self.add_node(nodes, FixedReplicationNode(descriptor))
+        return fixed_replication_node.members, descriptor.members, descriptor.n_repeats
 
-    def wire_delayed_replication_descriptor(self, descriptor):
+    def wire_delayed_replication_descriptor(self, descriptor, nodes):
         """
         :param DelayedReplicationDescriptor descriptor:
+        :return: The nodes list, members and number of passes to wire the members
         """
-        delayed_replication_node = DelayedReplicationNode(descriptor)
-        nodes = self.decoded_nodes
-        self.decoded_nodes = delayed_replication_node.members
+        delayed_replication_node = self.add_node(nodes, DelayedReplicationNode(descriptor))
 
         # Add the delayed replication factor node to the node indices as well as
         # it is possible to have attributes attached to it. For an example,
         # ocea_133.bufr from benchmark data has QA info attached to 031001.
         factor_node = self.add_delayed_replication_factor_node()
         delayed_replication_node.factor = factor_node
-        for _ in range(self.decoded_values[factor_node.index]):
-            self.wire_members(descriptor.members)
-        self.decoded_nodes = nodes
+        return (delayed_replication_node.members, descriptor.members,
+                self.decoded_values[factor_node.index])
 
-        self.add_node(delayed_replication_node)
-
-    def wire_sequence_descriptor(self, descriptor):
-        sequence_node = SequenceNode(descriptor)
-        nodes = self.decoded_nodes
-        self.decoded_nodes = sequence_node.members
-        self.wire_members(descriptor.members)
-        self.decoded_nodes = nodes
-
-        self.add_node(sequence_node)
+    def wire_sequence_descriptor(self, descriptor, nodes):
+        sequence_node = self.add_node(nodes, SequenceNode(descriptor))
+        return sequence_node.members, descriptor.members, 1
 
     def wire_bitmap_attribute(self, attr_node):
         self.index_to_node[self.bitmap_links[attr_node.index]].add_attribute(attr_node)
 
-    def wire_operator_descriptor(self, descriptor):
+    def wire_operator_descriptor(self, descriptor, nodes):
         """
         :param OperatorDescriptor descriptor:
         :return:
         """
-        operator_code, operand_value = descriptor.operator_code, descriptor.operand_value
-
-        if operator_code in (201, 202, 203, 206, 207, 208,):
-            # nbits offset, scale offset, new refval, skip local, increment, change string length
-            self.add_node(NoValueDataNode(descriptor))
-
-        elif operator_code == 204:  # associated field
-            if operand_value == 0:
-                self.nbits_associated_list.pop()
-            else:
-                self.nbits_associated_list.append(operand_value)
-            self.add_node(NoValueDataNode(descriptor))
-
-        elif operator_code == 205:  # read string of YYY bytes
-            self.add_value_node()
-
-        # Data not present for following YYY descriptors except class 0-9 and 31
-        elif operator_code == 221:
-            self.data_not_present_count = operand_value
-            self.add_node(NoValueDataNode(descriptor))
-
-        elif operator_code == 222:  # quality info follows
-            self.waiting_for_qa_info_meaning = True
-            self.add_value_node()
-
-        elif operator_code == 223:  # substituted value
-            self.waiting_for_qa_info_meaning = False
-            if operand_value == 0:
-                self.add_value_node()
-            else:
-                node = self.add_node(SubstitutionNode(*self.get_next_descriptor_and_index()))
-                self.wire_bitmap_attribute(node)
-
-        elif operator_code == 224:  # 1st order stats
-            self.waiting_for_qa_info_meaning = False
-            if operand_value == 0:
-                self.waiting_for_1st_order_stats_meaning = True
-                self.add_value_node()
-            else:
-                node = self.add_node(FirstOrderStatsNode(*self.get_next_descriptor_and_index()))
-                node.add_attribute(self.first_order_stats_meaning)
-                self.wire_bitmap_attribute(node)
-
-        elif operator_code == 225:  # difference stats
-            self.waiting_for_qa_info_meaning = False
-            if operand_value == 0:
-                self.waiting_for_difference_stats_meaning = True
-                self.add_value_node()
-            else:
-                node = self.add_node(DifferenceStatsNode(*self.get_next_descriptor_and_index()))
-                node.add_attribute(self.difference_stats_meaning)
-                self.wire_bitmap_attribute(node)
-
-        elif operator_code == 232:  # replaced/retained value
-            self.waiting_for_qa_info_meaning = False
-            if operand_value == 0:
-                self.add_value_node()
-            else:
-                node = self.add_node(ReplacementNode(*self.get_next_descriptor_and_index()))
-                self.wire_bitmap_attribute(node)
-
-        elif operator_code == 235:  # cancel all backwards data reference
-            self.waiting_for_qa_info_meaning = False
-            self.add_node(NoValueDataNode(descriptor))
-
-        elif operator_code == 236:
-            self.add_value_node()
-
-        elif operator_code == 237:
-            self.add_value_node()
-
-        else:  # TODO: 241, 242, 243
+        wire_method = self.operator_wire_methods.get(descriptor.operator_code)
+        if wire_method is None:  # TODO: 241, 242, 243
             raise NotImplementedError('Operator Descriptor {} not implemented'.format(descriptor))
+        wire_method(descriptor, nodes)
 
-    def wire_skippable_local_descriptor(self):
-        self.add_value_node()
+    def wire_no_value_operator(self, descriptor, nodes):
+        self.add_node(nodes, NoValueDataNode(descriptor))
 
-    def wire_members(self, members):
-        for member in members:
+    def wire_value_operator(self, descriptor, nodes):
+        self.add_value_node(nodes)
 
-            # 221 YYY data not present for following YYY descriptors except class 0-9 and 31
-            if self.data_not_present_count:
-                self.data_not_present_count -= 1
-                if isinstance(member, ElementDescriptor):
-                    X = member.X
-                    if not (1 <= X <= 9 or X == 31):  # skipping
-                        self.add_node(NoValueDataNode(member))
-                        continue
+    def wire_associated_field_operator(self, descriptor, nodes):
+        if descriptor.operand_value == 0:
+            self.nbits_associated_list.pop()
+        else:
+            self.nbits_associated_list.append(descriptor.operand_value)
+        self.add_node(nodes, NoValueDataNode(descriptor))
 
-            # Now process normally
-            if isinstance(member, ElementDescriptor):
-                self.wire_element_descriptor(member)
+    def wire_data_not_present_operator(self, descriptor, nodes):
+        self.data_not_present_count = descriptor.operand_value
+        self.add_node(nodes, NoValueDataNode(descriptor))
 
-            elif isinstance(member, FixedReplicationDescriptor):
-                self.wire_fixed_replication_descriptor(member)
+    def wire_quality_info_operator(self, descriptor, nodes):
+        self.waiting_for_qa_info_meaning = True
+        self.add_value_node(nodes)
 
-            elif isinstance(member, DelayedReplicationDescriptor):
-                self.wire_delayed_replication_descriptor(member)
+    def wire_substitution_operator(self, descriptor, nodes):
+        self.waiting_for_qa_info_meaning = False
+        if descriptor.operand_value == 0:
+            self.add_value_node(nodes)
+        else:
+            node = self.add_node(nodes, SubstitutionNode(*self.get_next_descriptor_and_index()))
+            self.wire_bitmap_attribute(node)
+
+    def wire_first_order_stats_operator(self, descriptor, nodes):
+        self.waiting_for_qa_info_meaning = False
+        if descriptor.operand_value == 0:
+            self.waiting_for_1st_order_stats_meaning = True
+            self.add_value_node(nodes)
+        else:
+            node = self.add_node(nodes, FirstOrderStatsNode(*self.get_next_descriptor_and_index()))
+            node.add_attribute(self.first_order_stats_meaning)
+            self.wire_bitmap_attribute(node)
+
+    def wire_difference_stats_operator(self, descriptor, nodes):
+        self.waiting_for_qa_info_meaning = False
+        if descriptor.operand_value == 0:
+            self.waiting_for_difference_stats_meaning = True
+            self.add_value_node(nodes)
+        else:
+            node = self.add_node(nodes, DifferenceStatsNode(*self.get_next_descriptor_and_index()))
+            node.add_attribute(self.difference_stats_meaning)
+            self.wire_bitmap_attribute(node)
+
+    def wire_replacement_operator(self, descriptor, nodes):
+        self.waiting_for_qa_info_meaning = False
+        if descriptor.operand_value == 0:
+            self.add_value_node(nodes)
+        else:
+            node = self.add_node(nodes, ReplacementNode(*self.get_next_descriptor_and_index()))
+            self.wire_bitmap_attribute(node)
 
-            elif isinstance(member, OperatorDescriptor):
-                self.wire_operator_descriptor(member)
+    def wire_cancel_backward_reference_operator(self, descriptor, nodes):
+        self.waiting_for_qa_info_meaning = False
+        self.add_node(nodes, NoValueDataNode(descriptor))
 
-            elif isinstance(member, SequenceDescriptor):
-                self.wire_sequence_descriptor(member)
+    def wire_skippable_local_descriptor(self, descriptor, nodes):
+        self.add_value_node(nodes)
 
-            elif isinstance(member, SkippedLocalDescriptor):
-                self.wire_skippable_local_descriptor()
+    def get_wire_method(self, descriptor_type):
+        """
+        Resolve the wire method for the given type of descriptor. The result is
+        cached so that subsequent members of the same type are dispatched with
+        a single dict lookup.
+        """
+        for base_type, method_name in WIRE_METHOD_NAMES:
+            if issubclass(descriptor_type, base_type):
+                wire_method = self.wire_methods[descriptor_type] = getattr(self, method_name)
+                return wire_method
 
-            elif isinstance(member, UndefinedElementDescriptor):
-                # TODO: assume any undefined element descriptor here is a skipped local
-                self.wire_skippable_local_descriptor()
+        raise PyBufrKitError('Cannot wire descriptor type: {}'.format(descriptor_type))
 
-            else:
-                raise PyBufrKitError('Cannot wire descriptor type: {}'.format(type(member)))
+    def wire_members(self, members, nodes):
+        """
+        Wire the given members. Instead of recursing, replications and sequences
+        return the list for their member nodes and how many times the members
+        should be wired, which is then pushed onto an explicit stack.
+        """
+        wire_methods = self.wire_methods
+        # Each frame is the members, the iterator of the current pass, the
+        # number of remaining passes and the list to add nodes to.
+        stack = [[members, iter(members), 0, nodes]]
+        while stack:
+            frame = stack[-1]
+            nodes = frame[3]
+            for member in frame[1]:
+
+                # 221 YYY data not present for following YYY descriptors except class 0-9 and 31
+                data_not_present_count = self.data_not_present_count
+                if data_not_present_count:
+                    self.data_not_present_count = data_not_present_count - 1
+                    if isinstance(member, ElementDescriptor):
+                        X = member.X
+                        if not (1 <= X <= 9 or X == 31):  # skipping
+                            self.add_node(nodes, NoValueDataNode(member))
+                            continue
+
+                # Now process normally
+                member_type = type(member)
+                wire_method = wire_methods.get(member_type)
+                if wire_method is None:
+                    wire_method = self.get_wire_method(member_type)
+                child = wire_method(member, nodes)
+
+                if child is not None:
+                    child_nodes, child_members, n_passes = child
+                    if n_passes > 0:
+                        stack.append([child_members, iter(child_members), n_passes - 1, child_nodes])
+                        break
+
+            else:  # the current pass is exhausted
+                if frame[2] > 0:
+                    frame[2] -= 1
+                    frame[1] = iter(frame[0])
+                else:
+                    stack.pop()
+
+
+# The wire method of each type of descriptors. The order matters as the first
+# matching type wins when resolving the method for a subclass.
+WIRE_METHOD_NAMES = (
+    (ElementDescriptor, 'wire_element_descriptor'),
+    (FixedReplicationDescriptor, 'wire_fixed_replication_descriptor'),
+    (DelayedReplicationDescriptor, 'wire_delayed_replication_descriptor'),
+    (OperatorDescriptor, 'wire_operator_descriptor'),
+    (SequenceDescriptor, 'wire_sequence_descriptor'),
+    (SkippedLocalDescriptor, 'wire_skippable_local_descriptor'),
+    # TODO: assume any undefined element descriptor here is a skipped local
+    (UndefinedElementDescriptor, 'wire_skippable_local_descriptor'),
+)
+
+OPERATOR_WIRE_METHOD_NAMES = {
+    # nbits offset, scale offset, new refval, skip local, increment, change string length
+    201: 'wire_no_value_operator',
+    202: 'wire_no_value_operator',
+    203: 'wire_no_value_operator',
+    206: 'wire_no_value_operator',
+    207: 'wire_no_value_operator',
+    208: 'wire_no_value_operator',
+    204: 'wire_associated_field_operator',
+    205: 'wire_value_operator',  # read string of YYY bytes
+    # Data not present for following YYY descriptors except class 0-9 and 31
+    221: 'wire_data_not_present_operator',
+    222: 'wire_quality_info_operator',
+    223: 'wire_substitution_operator',
+    224: 'wire_first_order_stats_operator',
+    225: 'wire_difference_stats_operator',
+    232: 'wire_replacement_operator',  # replaced/retained value
+    235: 'wire_cancel_backward_reference_operator',
+    236: 'wire_value_operator',
+    237: 'wire_value_operator',
+}
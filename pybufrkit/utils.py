@@ -6,8 +6,11 @@ from __future__ import absolute_import
 from __future__ import print_function
 
 import ast
+import functools
+import io
 import json
-import six
+import itertools
+import math
 
 
 def flatten_list(values):
@@ -18,24 +21,81 @@ def flatten_list(values):
     :return:
     """
     flat_values = []
-    for entry in values:
-        if isinstance(entry, list):
-            flat_values += flatten_list(entry)
+    append = flat_values.append
+    # Walk the nested lists with an explicit stack of iterators instead of recursion
+    stack = [iter(values)]
+    while stack:
+        for entry in stack[-1]:
+            if isinstance(entry, list):
+                stack.append(iter(entry))
+                break
+            append(entry)
         else:
-            flat_values.append(entry)
+            stack.pop()
     return flat_values
 
 
 # Encode bytes as string for Python 3
 class EntityEncoder(json.JSONEncoder):
     def default(self, o):
-        if isinstance(o, six.binary_type):
+        if isinstance(o, bytes):
             return o.decode(encoding='latin-1')
 
         return json.JSONEncoder.default(self, o)
 
 
-JSON_DUMPS_KWARGS = {'encoding': 'latin-1'} if six.PY2 else {'cls': EntityEncoder}
+JSON_DUMPS_KWARGS = {'cls': EntityEncoder}
+
+
+def _bytes_to_str(o):
+    if isinstance(o, (bytes, bytearray)):
+        return o.decode(encoding='latin-1')
+    raise TypeError('Object of type {} is not JSON serializable'.format(type(o).__name__))
+
+
+try:  # orjson is optional. It serializes decoded messages much faster.
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _has_non_finite_float(obj):
+    """
+    Whether the given object of nested lists, tuples and dicts has any NaN
+    or infinite float.
+    """
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if isinstance(o, float):
+            if not math.isfinite(o):
+                return True
+        elif isinstance(o, (list, tuple)):
+            stack.extend(o)
+        elif isinstance(o, dict):
+            stack.extend(o.values())
+    return False
+
+
+def json_dumps(obj, fast=False):
+    """
+    Serialize the given object to a JSON string with bytes decoded as latin-1.
+
+    :param obj: The object to serialize, e.g. output of the JSON renderers.
+    :param bool fast: Use orjson if it is installed. The output is then compact
+        and has non-ASCII characters unescaped. It loads to the same object as
+        the default output. Objects that orjson cannot serialize the same way,
+        e.g. with NaN or infinite floats, fall back to the default output.
+        The default output is always that of json.dumps with EntityEncoder,
+        regardless of installed packages.
+    :return: The JSON string
+    """
+    if fast and orjson is not None and not _has_non_finite_float(obj):
+        try:
+            return orjson.dumps(obj, default=_bytes_to_str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:  # e.g. integers beyond 64 bits
+            pass
+    return json.dumps(obj, **JSON_DUMPS_KWARGS)
 
 
 def fixed_width_repr_of_int(value, width, pad_left=True):
@@ -48,8 +108,29 @@ def fixed_width_repr_of_int(value, width, pad_left=True):
     :param int width: The result string must have the exact width 
     :return: A string representation of the given integer. 
     """
-    ret = '{:{pad_dir}{width}d}'.format(value, pad_dir='>' if pad_left else '>', width=width)
-    return '*' * width if len(ret) > width else ret
+    # NOTE: the value is right aligned regardless of pad_left, as it always has been
+    ret = str(value)
+    return '*' * width if len(ret) > width else ret.rjust(width)
+
+
+def flag_bits_of_int(value, nbits):
+    """
+    Find the bits that are set in the given value of a flag table. Bits are
+    numbered from 1 starting at the most significant bit, as in flag tables.
+
+    :param int value: The value of a flag table
+    :param int nbits: Number of bits of the flag table
+    :return: A list of the numbers of the bits that are set. Bits beyond
+        nbits are ignored.
+    """
+    value &= (1 << nbits) - 1
+    bits = []
+    while value:
+        lowest_bit = value & -value
+        bits.append(nbits - lowest_bit.bit_length() + 1)
+        value ^= lowest_bit
+    bits.reverse()
+    return bits
 
 
 def nested_json_to_flat_json(nested_json_data):
@@ -80,63 +161,131 @@ def template_data_nested_json_to_flat_json(template_data_value):
     Helper function to convert nested JSON of template data to flat JSON.
     """
 
-    def process_value_parameter(data, parameter):
+    def iter_attribute_values(attributes):
         # Just process the first layer of attributes. No value is needed
         # from any nested attributes as they must be virtual
-        for attr in parameter.get('attributes', []):
+        for attr in attributes:
             if 'virtual' not in attr:
-                data.append(attr['value'])
-        # Associated Field value appears before the value of the owner node
-        data.append(parameter['value'])
-
-    def process_members(data, members):
-        for parameter in members:
-            if 'value' in parameter:
-                process_value_parameter(data, parameter)
-
+                yield attr['value']
+
+    def iter_values(members):
+        # Descend into nested members with an explicit stack of iterators
+        stack = [iter(members)]
+        while stack:
+            for parameter in stack[-1]:
+                if 'value' in parameter:
+                    # Associated Field value appears before the value of the owner node
+                    attributes = parameter.get('attributes')
+                    if attributes:
+                        yield from iter_attribute_values(attributes)
+                    yield parameter['value']
+
+                else:
+                    factor = parameter.get('factor')
+                    if factor is not None:
+                        attributes = factor.get('attributes')
+                        if attributes:
+                            yield from iter_attribute_values(attributes)
+                        yield factor['value']
+
+                    if 'members' in parameter:
+                        if parameter['id'][0] == '1':  # Replication
+                            stack.append(itertools.chain.from_iterable(parameter['members']))
+                        else:
+                            stack.append(iter(parameter['members']))
+                        break
             else:
-                if 'factor' in parameter:
-                    process_value_parameter(data, parameter['factor'])
+                stack.pop()
 
-                if 'members' in parameter:
-                    if parameter['id'].startswith('1'):  # Replication
-                        for members in parameter['members']:
-                            process_members(data, members)
-                    else:
-                        process_members(data, parameter['members'])
+    return [list(iter_values(nested_subset_data)) for nested_subset_data in template_data_value]
 
-    data_all_subsets = []
-    for nested_subset_data in template_data_value:
-        flat_subset_data = []
-        process_members(flat_subset_data, nested_subset_data)
-        data_all_subsets.append(flat_subset_data)
 
-    return data_all_subsets
+# Scalar values that still need parsing, e.g. bytes with escapes, tend to
+# repeat across subsets. Only scalar literals are cached because their values
+# are immutable and can be shared. Container literals, e.g. flag table values
+# rendered as (2048, [4]), may hold lists and are always parsed afresh.
+_cached_literal_eval = functools.lru_cache(maxsize=512)(ast.literal_eval)
+_CONTAINER_LITERAL_OPENINGS = ('(', '[', '{')
 
 
+def _literal_eval(s):
+    """
+    Evaluate the literal of a value from the text output. Most values are
+    numbers, which are converted directly without parsing them as Python
+    expressions with ast.literal_eval. So are bytes without escapes.
+    """
+    c = s[:1]
+    if c == '-' or c.isdigit():
+        try:
+            return int(s)
+        except ValueError:
+            try:
+                return float(s)
+            except ValueError:
+                pass
+    elif c == 'b' and len(s) > 2 and s[1] == s[-1] and s[1] in ('"', "'") and '\\' not in s:
+        return s[2:-1].encode('latin-1')
+    elif c in _CONTAINER_LITERAL_OPENINGS:
+        return ast.literal_eval(s)
+    return _cached_literal_eval(s)
+
+
+# Both headers are six characters long so lines are checked with line[:6]
 TEXT_SECTION_HEADER = '<<<<<<'
 TEXT_SUBSET_HEADER = '######'
+# Start of a bytes value in the nested text output keyed by its closing quote
+_TEXT_BYTES_LEFT_BOUNDS = {'"': ' b"', "'": " b'"}
+
 
+class PeekableLines(object):
+    """
+    Read lines of the given text one at a time with a single line lookahead.
+    Lines are produced as they are read so that the entire text does not need
+    to be split into a list of lines upfront.
 
-def section_text_to_flat_json(lines, idxline, func_subsets_text_to_flat_json):
+    :param str text: The text to read lines from.
+    """
+
+    def __init__(self, text):
+        self._lines = iter(io.StringIO(text))
+        self._next_line = None
+        self._advance()
+
+    def _advance(self):
+        line = next(self._lines, None)
+        self._next_line = None if line is None else line.rstrip('\r\n')
+
+    def peek(self):
+        """Return the next line without consuming it or None if there is no more line"""
+        return self._next_line
+
+    def next(self):
+        """Consume and return the next line or None if there is no more line"""
+        line = self._next_line
+        self._advance()
+        return line
+
+
+def section_text_to_flat_json(lines, func_subsets_text_to_flat_json):
     """
     Convert a section from text output to a section of flat JSON.
+
+    :param PeekableLines lines: The lines of the text output
     """
     section_data = []
-    idxline += 1  # skip the section header
-    while idxline < len(lines):
-        line = lines[idxline]
-        if line.startswith(TEXT_SECTION_HEADER):
+    lines.next()  # skip the section header
+    while True:
+        line = lines.peek()
+        if line is None or line[:6] == TEXT_SECTION_HEADER:
             break
-        if line.startswith(TEXT_SUBSET_HEADER):
-            idxline, data_all_subsets = func_subsets_text_to_flat_json(lines, idxline)
-            section_data.append(data_all_subsets)
+        if line[:6] == TEXT_SUBSET_HEADER:
+            section_data.append(func_subsets_text_to_flat_json(lines))
             continue
+        lines.next()
         parameter_name, value = line.split(' = ')
-        section_data.append(ast.literal_eval(value))
-        idxline += 1
+        section_data.append(_literal_eval(value))
 
-    return idxline, section_data
+    return section_data
 
 
 def flat_text_to_flat_json(flat_text):
@@ -146,36 +295,34 @@ def flat_text_to_flat_json(flat_text):
     :param str flat_text: The flat text output
     """
     flat_json = []
+    lines = PeekableLines(flat_text)
     # Skip the first line of table group key info
-    lines = flat_text.splitlines()[1:]
-    idxline = 0
-    while idxline < len(lines):
-        idxline, section_data = section_text_to_flat_json(lines, idxline, subsets_flat_text_to_flat_json)
-        flat_json.append(section_data)
+    lines.next()
+    while lines.peek() is not None:
+        flat_json.append(section_text_to_flat_json(lines, subsets_flat_text_to_flat_json))
 
     return flat_json
 
 
-def subsets_flat_text_to_flat_json(lines, idxline):
+def subsets_flat_text_to_flat_json(lines):
     """
     Convert all subsets data from flat text output to all subsets data of flat JSON.
     """
     data_all_subsets = []
     while True:
-        line = lines[idxline]
-        if line.startswith(TEXT_SECTION_HEADER):
+        line = lines.peek()
+        if line is None or line[:6] == TEXT_SECTION_HEADER:
             break
-        if line.startswith(TEXT_SUBSET_HEADER):
+        lines.next()
+        if line[:6] == TEXT_SUBSET_HEADER:
             data_all_subsets.append([])
-            idxline += 1
             continue
-        value = ast.literal_eval(line[81:].strip())
+        value = _literal_eval(line[81:].strip())
         if isinstance(value, tuple):
             value = value[0]
         data_all_subsets[-1].append(value)
-        idxline += 1
 
-    return idxline, data_all_subsets
+    return data_all_subsets
 
 
 def nested_text_to_flat_json(nested_text):
@@ -185,56 +332,63 @@ def nested_text_to_flat_json(nested_text):
     :return: A flat JSON object
     """
     flat_json = []
+    lines = PeekableLines(nested_text)
     # Skip the first line of table group key info
-    lines = nested_text.splitlines()[1:]
-    idxline = 0
-    while idxline < len(lines):
-        idxline, section_data = section_text_to_flat_json(lines, idxline, subsets_nested_text_to_flat_json)
-        flat_json.append(section_data)
+    lines.next()
+    while lines.peek() is not None:
+        flat_json.append(section_text_to_flat_json(lines, subsets_nested_text_to_flat_json))
 
     return flat_json
 
 
-def subsets_nested_text_to_flat_json(lines, idxline):
+def subsets_nested_text_to_flat_json(lines):
     """
     Convert all subsets data from nested text format to flat JSON format.
     """
     data_all_subsets = []
     while True:
-        line = lines[idxline].strip()
-        if line.startswith(TEXT_SECTION_HEADER):
+        line = lines.peek()
+        if line is None:
             break
-        if line.startswith(TEXT_SUBSET_HEADER):
-            data_all_subsets.append([])
-            idxline += 1
+        line = line.strip()
+        # Dispatch on the leading character so most lines need a single check
+        c = line[:1]
+        if c == '<' and line[:6] == TEXT_SECTION_HEADER:
+            break
+        lines.next()
+        # Subset header, or comments (replication header)
+        if c == '#':
+            if line[:6] == TEXT_SUBSET_HEADER:
+                data_all_subsets.append([])
             continue
-        # Skip comments (replication header), attributed fields and Sequence descriptors
-        if line.startswith('#') \
-                or (line.startswith('->') and not line.startswith('-> A')) \
-                or line.startswith('3'):
-            idxline += 1
+        # Skip Sequence descriptors
+        if c == '3':
             continue
+        # Skip attributed fields except associated fields
+        is_associated_field = False
+        if c == '-':
+            if line[:4] == '-> A':
+                is_associated_field = True
+            elif line[:2] == '->':
+                continue
 
         # Entries with no values, e.g. 204YYY, 1XXYYY
         if ' ' not in line:
-            idxline += 1
             continue
 
-        line_trailing_char = line[-1]
-        if line_trailing_char not in ('"', "'"):
-            value = ast.literal_eval(line.rsplit(' ', 1)[1])
+        string_left_bound = _TEXT_BYTES_LEFT_BOUNDS.get(line[-1])
+        if string_left_bound is None:
+            value = _literal_eval(line.rsplit(' ', 1)[1])
         else:
-            string_left_bound = (' ' if six.PY2 else ' b') + line_trailing_char
             idxval = line.rfind(string_left_bound, 0, len(line) - 1)
-            value = ast.literal_eval(line[idxval + 1:])
+            value = _literal_eval(line[idxval + 1:])
 
         # Insert associated field before the owner field
-        if line.startswith('-> A'):
+        if is_associated_field:
             data_all_subsets[-1].insert(-1, value)
         else:
             data_all_subsets[-1].append(value)
-        idxline += 1
-    return idxline, data_all_subsets
+    return data_all_subsets
 
 
 def generate_quiet(iterable, next_val):
@@ -14,7 +14,7 @@ def get_version():
 
 
 def get_requirements():
-    requirements = ['bitstring>=3.1.3', 'six']
+    requirements = ['bitstring>=3.1.3']
     return requirements
 
 
@@ -26,7 +26,11 @@ setup(
     package_dir={'pybufrkit': 'pybufrkit'},
     include_package_data=True,
     setup_requires=["pytest-runner"],
+    python_requires='>=3.7',
     install_requires=get_requirements(),
+    extras_require={
+        'orjson': ['orjson'],
+    },
     tests_require=['pytest'],
     entry_points={
         'console_scripts': ['pybufrkit = pybufrkit:main'],
@@ -44,10 +48,12 @@ setup(
         "Intended Audience :: Science/Research",
         "Operating System :: OS Independent",
         "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 2.7",
-        "Programming Language :: Python :: 3.5",
-        "Programming Language :: Python :: 3.6",
+        "Programming Language :: Python :: 3",
         "Programming Language :: Python :: 3.7",
+        "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
         "Topic :: Utilities",
     ],
     keywords=['BUFR', 'WMO'],
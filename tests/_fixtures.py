@@ -0,0 +1,33 @@
+"""
+Sample data shared by the test modules.
+"""
+import os
+import functools
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+# Stubs of the sample files in the data directory, each of which comes as
+# <stub>.bufr, <stub>.json and <stub>.values.cmp
+FILENAME_STUBS = (
+    'IUSK73_AMMC_182300',
+    'rado_250',  # uncompressed with 222000, 224000, 236000
+    '207003',  # compressed with delayed replication
+    'amv2_87',  # compressed with 222000
+    'b005_89',  # compressed with 222000 and 224000 (1st order stats)
+    'profiler_european',  # uncompressed with 204001 associated fields
+    'jaso_214',  # compressed with 204001 associated fields
+    'uegabe',  # uncompressed with 204004 associated fields
+    'asr3_190',  # compressed with complex replication and 222000, 224000
+    'b002_95',  # uncompressed with skipped local descriptors
+    'g2nd_208',  # compressed with identical string values for all subsets
+    'ISMD01_OKPR',  # compressed with different string values for subsets
+    'mpco_217',
+)
+
+
+# The sample files do not change during a test run and bytes are immutable
+@functools.lru_cache(maxsize=None)
+def read_bufr_file(file_name):
+    with open(os.path.join(DATA_DIR, file_name), 'rb') as ins:
+        s = ins.read()
+    return s
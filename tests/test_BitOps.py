@@ -0,0 +1,88 @@
+import unittest
+
+from pybufrkit.errors import BitReadError, BitWriteError
+from pybufrkit.bitops import BytesBitReader, BytesBitWriter, _bitstring_fmt_string
+
+
+class BytesBitReaderTests(unittest.TestCase):
+    def test_read_across_byte_boundaries(self):
+        bit_reader = BytesBitReader(b'\xa5\x0f\xf0\x81')
+        assert bit_reader.read_uint(3) == 5
+        assert bit_reader.read_bin(6) == '001010'
+        assert bit_reader.read_bool() is False
+        assert bit_reader.read_uint(0) == 0
+        assert bit_reader.read_uint(7) == 0x1f
+        assert bit_reader.get_pos() == 17
+        assert bit_reader.read_bytes(1) == b'\xe1'
+        assert bit_reader.read_int(7) == 1
+        assert bit_reader.get_pos() == 32
+
+    def test_read_aligned_bytes(self):
+        bit_reader = BytesBitReader(b'BUFR\x00\x01')
+        assert bit_reader.read_bytes(4) == b'BUFR'
+        assert bit_reader.read_uint(16) == 1
+
+    def test_read_off_the_end(self):
+        bit_reader = BytesBitReader(b'\xff')
+        bit_reader.read_uint(5)
+        self.assertRaises(BitReadError, bit_reader.read_uint, 4)
+        self.assertRaises(BitReadError, bit_reader.read_bytes, 1)
+
+    def test_read_uints(self):
+        bit_reader = BytesBitReader(b'\xa5\x0f\xf0\x81')
+        bit_reader.read_uint(3)
+        assert bit_reader.read_uints(5, 4) == [0b00101, 0b00001, 0b11111, 0b11000]
+        assert bit_reader.read_uints(0, 2) == [0, 0]
+        assert bit_reader.get_pos() == 23
+        self.assertRaises(BitReadError, bit_reader.read_uints, 3, 4)
+
+
+class BytesBitWriterTests(unittest.TestCase):
+    def test_write_across_byte_boundaries(self):
+        bit_writer = BytesBitWriter()
+        bit_writer.write_uint(5, 3)
+        bit_writer.write_bin('001010')
+        bit_writer.write_bool(False)
+        bit_writer.write_uint(0x1f, 7)
+        assert bit_writer.get_pos() == 17
+        bit_writer.write_bytes(b'\xe1')
+        bit_writer.write_int(1, 7)
+        assert bit_writer.to_bytes() == b'\xa5\x0f\xf0\x81'
+
+    def test_write_and_read_back(self):
+        bit_writer = BytesBitWriter()
+        bit_writer.write_bytes('BUFR')
+        bit_writer.write_uint(0, 24)
+        bit_writer.write_int(-3, 5)
+        bit_writer.write_bytes('AB', 3)
+        bit_writer.skip(3)
+        bit_writer.set_uint(34, 24, 32)
+        assert bit_writer.get_pos() == 88
+
+        bit_reader = BytesBitReader(bit_writer.to_bytes())
+        assert bit_reader.read_bytes(4) == b'BUFR'
+        assert bit_reader.read_uint(24) == 34
+        assert bit_reader.read_int(5) == -3
+        assert bit_reader.read_bytes(3) == b'AB '
+        assert bit_reader.read_uint(3) == 0
+
+    def test_set_uint_into_pending_bits(self):
+        bit_writer = BytesBitWriter()
+        bit_writer.write_uint(0, 12)
+        bit_writer.set_uint(0xabc, 12, 0)
+        bit_writer.write_uint(0xd, 4)
+        assert bit_writer.to_bytes() == b'\xab\xcd'
+
+    def test_write_value_too_big(self):
+        bit_writer = BytesBitWriter()
+        self.assertRaises(BitWriteError, bit_writer.write_uint, 8, 3)
+        self.assertRaises(BitWriteError, bit_writer.write_uint, -1, 3)
+
+
+class BitStringFormatStringTests(unittest.TestCase):
+    def test_format_strings(self):
+        assert _bitstring_fmt_string('uint', 16) == 'uintbe:16'
+        assert _bitstring_fmt_string('uint', 7) == 'uint:7'
+        assert _bitstring_fmt_string('bytes', 4) == 'bytes:4'
+        assert _bitstring_fmt_string('bin', 8) == 'bin:8'
+        assert _bitstring_fmt_string('uint', 16) is _bitstring_fmt_string('uint', 16)
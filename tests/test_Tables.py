@@ -1,8 +1,7 @@
-from __future__ import absolute_import
 import unittest
 
 from pybufrkit.renderer import FlatTextRenderer
-from pybufrkit.tables import TableGroupCacheManager
+from pybufrkit.tables import TableGroupCacheManager, template_from_ids
 from pybufrkit.descriptors import flat_member_ids
 
 
@@ -142,3 +141,18 @@ class TablesTests(unittest.TestCase):
     def test_table_group_02(self):
         template = self.table_group.lookup(340008)
         assert self.flat_text_renderer.render(template) == table_group_02_cmp
+
+    def test_template_from_ids_is_cached(self):
+        template = template_from_ids(self.table_group, (309052,))
+        assert template_from_ids(self.table_group, (309052,)) is template
+        assert template_from_ids(self.table_group, (311001,)) is not template
+        assert [str(member) for member in template.members] == ['309052']
+
+    def test_template_original_descriptor_ids(self):
+        template = self.table_group.template_from_ids('001001', '101002', '001002')
+        ids = template.original_descriptor_ids
+        assert ids == [1001, 101002, 1002]
+        # A fresh list is returned every time, so the cached key is unaffected by changes
+        ids.append(1003)
+        assert template.original_descriptor_ids == [1001, 101002, 1002]
+        assert template.original_descriptor_ids_key == (1001, 101002, 1002)
@@ -1,11 +1,12 @@
-from __future__ import absolute_import
-from __future__ import print_function
 import os
 import json
 import unittest
+from unittest import mock
 
 from pybufrkit.tables import TableGroupCacheManager
-from pybufrkit.templatecompiler import TemplateCompiler, loads_compiled_template
+from pybufrkit.templatecompiler import (TemplateCompiler, BoundMethods, CompiledTemplateManager,
+                                        compile_template, loads_compiled_template,
+                                        dumps_compiled_template_py, loads_compiled_template_py)
 from pybufrkit.decoder import Decoder
 
 BASE_DIR = os.path.dirname(__file__)
@@ -13,6 +14,18 @@ DATA_DIR = os.path.join(BASE_DIR, 'data')
 
 
 class TemplateCompilerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Messages decoded without compiled templates are the reference results
+        # for the comparison tests. Decode them only once for all of the tests.
+        benchmark_data_dir = os.path.join(BASE_DIR, 'benchmark_data')
+        decoder_noncompiled = Decoder()
+        cls.benchmark_data = []
+        for filename in sorted(os.listdir(benchmark_data_dir)):
+            with open(os.path.join(benchmark_data_dir, filename), 'rb') as ins:
+                s = ins.read()
+            cls.benchmark_data.append((s, decoder_noncompiled.process(s)))
+
     def setUp(self):
         self.template_compiler = TemplateCompiler()
 
@@ -30,22 +43,149 @@ class TemplateCompilerTests(unittest.TestCase):
 
         assert reconstructed_compiled_template.to_dict() == compiled_template.to_dict()
 
+    def test_loaded_compiled_templates_share_template(self):
+        table_group = TableGroupCacheManager.get_table_group()
+        template = table_group.template_from_ids('309052')
+        s = json.dumps(self.template_compiler.process(template, table_group).to_dict())
+
+        compiled_template_1 = loads_compiled_template(s)
+        compiled_template_2 = loads_compiled_template(s)
+
+        assert compiled_template_1.template is compiled_template_2.template
+        assert compiled_template_1.to_dict() == compiled_template_2.to_dict()
+
+    def test_compile_template(self):
+        table_group = TableGroupCacheManager.get_table_group()
+        template = table_group.template_from_ids('309052')
+        compiled_template = self.template_compiler.process(template, table_group)
+
+        assert compile_template(template, table_group).to_dict() == compiled_template.to_dict()
+        # Nothing is carried over from previous runs
+        assert compile_template(template, table_group).to_dict() == compiled_template.to_dict()
+
+    def test_identical_coder_method_calls_are_shared(self):
+        table_group = TableGroupCacheManager.get_table_group()
+        template = table_group.template_from_ids('001001', '001002', '001001')
+        compiled_template = self.template_compiler.process(template, table_group)
+
+        statements = compiled_template.statements
+        assert statements[0] is statements[2]
+        assert statements[0] is not statements[1]
+
+    def test_small_fixed_replications_are_unrolled(self):
+        table_group = TableGroupCacheManager.get_table_group()
+
+        template = table_group.template_from_ids('102002', '001001', '001002')
+        compiled_template = self.template_compiler.process(template, table_group)
+        assert [s.method_name for s in compiled_template.statements] == ['process_numeric'] * 4
+
+        template = table_group.template_from_ids('102005', '001001', '001002')
+        compiled_template = self.template_compiler.process(template, table_group)
+        assert len(compiled_template.statements) == 1
+        assert compiled_template.statements[0].repeat == 5
+
+    def test_compiled_template_manager_evicts_least_recently_used(self):
+        table_group = TableGroupCacheManager.get_table_group()
+        template_1 = table_group.template_from_ids('309052')
+        template_2 = table_group.template_from_ids('311001')
+        template_3 = table_group.template_from_ids('301001')
+        compiled_template_manager = CompiledTemplateManager(2)
+        # Each manager compiles with its own compiler
+        assert isinstance(compiled_template_manager.template_compiler, TemplateCompiler)
+        assert compiled_template_manager.template_compiler is not CompiledTemplateManager(2).template_compiler
+
+        compiled_template_1 = compiled_template_manager.get_or_compile(template_1, table_group)
+        compiled_template_manager.get_or_compile(template_2, table_group)
+        # Use the first template again so the second one becomes the least recently used
+        assert compiled_template_manager.get_or_compile(template_1, table_group) is compiled_template_1
+        compiled_template_manager.get_or_compile(template_3, table_group)
+
+        assert len(compiled_template_manager.cache) == 2
+        assert compiled_template_manager.get_or_compile(template_1, table_group) is compiled_template_1
+        assert ((311001,), table_group.key) not in compiled_template_manager.cache
+
+    def test_compiled_template_manager_warmup(self):
+        table_group = TableGroupCacheManager.get_table_group()
+        templates = [table_group.template_from_ids('309052'), table_group.template_from_ids('311001')]
+        compiled_template_manager = CompiledTemplateManager(10)
+
+        compiled_templates = compiled_template_manager.warmup((t, table_group) for t in templates)
+
+        assert len(compiled_template_manager.cache) == 2
+        for template, compiled_template in zip(templates, compiled_templates):
+            assert compiled_template_manager.get_or_compile(template, table_group) is compiled_template
+
+    def test_compiled_template_manager_warmup_beyond_cache_max(self):
+        table_group = TableGroupCacheManager.get_table_group()
+        templates = [table_group.template_from_ids('309052'), table_group.template_from_ids('311001')]
+        compiled_template_manager = CompiledTemplateManager(1, use_python_func=False)
+
+        with self.assertLogs(level='WARNING'):
+            compiled_templates = compiled_template_manager.warmup((t, table_group) for t in templates)
+
+        assert len(compiled_templates) == 2
+        assert list(compiled_template_manager.cache.values()) == compiled_templates[1:]
+
+    def test_bound_methods_prefer_specialised_variants(self):
+        decoder = Decoder()
+        coder_methods = BoundMethods(decoder, '_compressed')
+
+        assert coder_methods['process_numeric'] == decoder.process_numeric_compressed
+        # Falls back to the plain method when no specialised variant exists
+        assert coder_methods['define_bitmap'] == decoder.define_bitmap
+        assert BoundMethods(decoder)['process_numeric'] == decoder.process_numeric
+
     def test_compiled_vs_noncompiled(self):
-        decoder_noncompiled = Decoder()
         decoder_compiled = Decoder(compiled_template_cache_max=200)
-        benchmark_data_dir = os.path.join(BASE_DIR, 'benchmark_data')
 
-        for filename in os.listdir(benchmark_data_dir):
-            with open(os.path.join(benchmark_data_dir, filename), 'rb') as ins:
-                s = ins.read()
+        for s, bufr_message_1 in self.benchmark_data:
+            bufr_message_2 = decoder_compiled.process(s)
+            assert bufr_message_1.template_data.value.decoded_descriptors_all_subsets == \
+                   bufr_message_2.template_data.value.decoded_descriptors_all_subsets
+
+            assert bufr_message_1.template_data.value.decoded_values_all_subsets == \
+                   bufr_message_2.template_data.value.decoded_values_all_subsets
+
+            assert bufr_message_1.template_data.value.bitmap_links_all_subsets == \
+                   bufr_message_2.template_data.value.bitmap_links_all_subsets
+
+    def test_python_func_vs_interpreted_statements(self):
+        decoder_python_func = Decoder(compiled_template_cache_max=200)
+        decoder_interpreted = Decoder(compiled_template_cache_max=200, compiled_template_use_python_func=False)
+
+        for s, _ in self.benchmark_data:
+            bufr_message_1 = decoder_python_func.process(s, info_only=True)
+            template, table_group = bufr_message_1.build_template(decoder_python_func.tables_root_dir, normalize=1)
+
+            bufr_message_1 = decoder_python_func.process(s)
+            with mock.patch('pybufrkit.templatecompiler.process_python_func') as mock_process_python_func:
+                bufr_message_2 = decoder_interpreted.process(s)
+            mock_process_python_func.assert_not_called()
+            assert decoder_python_func.compiled_template_manager.get_or_compile(
+                template, table_group).python_func is not None
+
+            assert bufr_message_1.template_data.value.decoded_values_all_subsets == \
+                   bufr_message_2.template_data.value.decoded_values_all_subsets
+
+            assert bufr_message_1.template_data.value.bitmap_links_all_subsets == \
+                   bufr_message_2.template_data.value.bitmap_links_all_subsets
+
+    def test_dumps_and_loads_compiled_template_py(self):
+        decoder_compiled = Decoder(compiled_template_cache_max=200)
+
+        for s, bufr_message_1 in self.benchmark_data:
+            bufr_message = decoder_compiled.process(s, info_only=True)
+            template, table_group = bufr_message.build_template(decoder_compiled.tables_root_dir, normalize=1)
+            compiled_template = decoder_compiled.compiled_template_manager.get_or_compile(template, table_group)
+            # Run the function loaded from the dumped Python source instead
+            python_func = loads_compiled_template_py(dumps_compiled_template_py(compiled_template))
+            compiled_template.python_func = python_func
 
-                bufr_message_1 = decoder_noncompiled.process(s)
-                bufr_message_2 = decoder_compiled.process(s)
-                assert bufr_message_1.template_data.value.decoded_descriptors_all_subsets == \
-                       bufr_message_2.template_data.value.decoded_descriptors_all_subsets
+            bufr_message_2 = decoder_compiled.process(s)
+            assert compiled_template.python_func is python_func
 
-                assert bufr_message_1.template_data.value.decoded_values_all_subsets == \
-                       bufr_message_2.template_data.value.decoded_values_all_subsets
+            assert bufr_message_1.template_data.value.decoded_values_all_subsets == \
+                   bufr_message_2.template_data.value.decoded_values_all_subsets
 
-                assert bufr_message_1.template_data.value.bitmap_links_all_subsets == \
-                       bufr_message_2.template_data.value.bitmap_links_all_subsets
+            assert bufr_message_1.template_data.value.bitmap_links_all_subsets == \
+                   bufr_message_2.template_data.value.bitmap_links_all_subsets
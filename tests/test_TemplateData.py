@@ -1,58 +1,89 @@
-from __future__ import absolute_import
-from __future__ import print_function
 import os
 import unittest
 
 from pybufrkit.decoder import Decoder
 from pybufrkit.renderer import NestedTextRenderer
 
+from _fixtures import FILENAME_STUBS, read_bufr_file
+
 BASE_DIR = os.path.dirname(__file__)
 DATA_DIR = os.path.join(BASE_DIR, 'data')
 
 
-def read_bufr_file(file_name):
-    with open(os.path.join(DATA_DIR, file_name), 'rb') as ins:
-        s = ins.read()
-    return s
+def node_tree(node):
+    """
+    The full structure of the given data node as nested tuples, including the
+    indices, members, replication factor and attributes, e.g. of bitmap links.
+    """
+    members = getattr(node, 'members', None)
+    factor = getattr(node, 'factor', None)
+    attributes = getattr(node, 'attributes', None)
+    return (
+        type(node).__name__,
+        node.descriptor.id,
+        getattr(node, 'index', None),
+        None if members is None else [node_tree(member) for member in members],
+        None if factor is None else node_tree(factor),
+        None if attributes is None else [(type(attr).__name__, attr.index) for attr in attributes],
+    )
 
 
 class TemplateDataTests(unittest.TestCase):
-    def setUp(self):
-        self.decoder = Decoder()
-        self.filename_stubs = [
-            'IUSK73_AMMC_182300',
-            'rado_250',  # uncompressed with 222000, 224000, 236000
-            '207003',  # compressed with delayed replication
-            'amv2_87',  # compressed with 222000
-            'b005_89',  # compressed with 222000 and 224000 (1st order stats)
-            'profiler_european',  # uncompressed with 204001 associated fields
-            'jaso_214',  # compressed with 204001 associated fields
-            'uegabe',  # uncompressed with 204004 associated fields
-            'asr3_190',  # compressed with complex replication and 222000, 224000
-            'b002_95',  # uncompressed with skipped local descriptors
-            'g2nd_208',  # compressed with identical string values for all subsets
-            'ISMD01_OKPR',  # compressed with different string values for subsets
-            'mpco_217',
-        ]
+    @classmethod
+    def setUpClass(cls):
+        cls.decoder = Decoder()
+        cls.renderer = NestedTextRenderer()
+        cls.filename_stubs = FILENAME_STUBS
+        cls.wired_bufr_messages = {}
+
+    def decode_wired(self, filename_stub):
+        # Wired messages are only read by the tests so they are decoded once and shared
+        bufr_message = self.wired_bufr_messages.get(filename_stub)
+        if bufr_message is None:
+            bufr_message = self.decoder.process(read_bufr_file(filename_stub + '.bufr'), filename_stub)
+            self.wired_bufr_messages[filename_stub] = bufr_message
+        return bufr_message
 
     def do_test(self, filename_stub):
-        s = read_bufr_file(filename_stub + '.bufr')
-        bufr_message = self.decoder.process(s, filename_stub)
+        bufr_message = self.decode_wired(filename_stub)
 
         if filename_stub in ('207003', 'rado_250'):
             with open(os.path.join(DATA_DIR,
                                    '{}.datadump.cmp'.format(filename_stub))) as ins:
                 cmp_str = ins.read()
-            dump_str = NestedTextRenderer().render(bufr_message.template_data.value)
+            dump_str = self.renderer.render(bufr_message.template_data.value)
             # TODO: this is to fix the inconsistent int and long of bitstring on different OS
             dump_str = dump_str.replace(
                 '005040 ORBIT NUMBER 5258\n', '005040 ORBIT NUMBER 5258L\n')
-            assert dump_str == cmp_str, dump_str
+            if dump_str != cmp_str:
+                # Report the first differing line instead of the whole dump
+                dump_lines, cmp_lines = dump_str.splitlines(), cmp_str.splitlines()
+                for idx, (line, cmp_line) in enumerate(zip(dump_lines, cmp_lines)):
+                    assert line == cmp_line, 'At line {}: {!r} != {!r}'.format(idx + 1, line, cmp_line)
+                assert len(dump_lines) == len(cmp_lines), \
+                    'Number of lines {} != {}'.format(len(dump_lines), len(cmp_lines))
+                assert dump_str == cmp_str, 'Line endings differ'
         else:
-            NestedTextRenderer().render(bufr_message.template_data.value)
+            self.renderer.render(bufr_message.template_data.value)
 
     def test_template_data(self):
         print()
         for filename_stub in self.filename_stubs:
             print(filename_stub)
-            self.do_test(filename_stub)
+            with self.subTest(filename_stub=filename_stub):
+                self.do_test(filename_stub)
+
+    def test_iter_wired_subsets(self):
+        for filename_stub in self.filename_stubs:
+            with self.subTest(filename_stub=filename_stub):
+                s = read_bufr_file(filename_stub + '.bufr')
+                template_data = self.decoder.process(s, filename_stub, wire_template_data=False).template_data.value
+                wired_template_data = self.decode_wired(filename_stub).template_data.value
+
+                idx_subsets = []
+                for idx_subset, nodes in template_data.iter_wired_subsets():
+                    idx_subsets.append(idx_subset)
+                    assert [node_tree(node) for node in nodes] == \
+                           [node_tree(node) for node in wired_template_data.decoded_nodes_all_subsets[idx_subset]]
+
+                assert idx_subsets == list(range(wired_template_data.n_subsets))
@@ -1,50 +1,76 @@
-from __future__ import absolute_import
-from __future__ import print_function
 import os
-import tempfile
-import shutil
+import json
+import argparse
 
-from pybufrkit.commands import command_encode
+import pytest
+
+from pybufrkit.commands import command_encode, command_decode
 
 BASE_DIR = os.path.dirname(__file__)
 DATA_DIR = os.path.join(BASE_DIR, 'data')
 
 
-class NS(object):
-
-    def __init__(self, m):
-        self._m = m
+def encode_args(**kwargs):
+    """Namespace of the encode command arguments with the defaults of the command line"""
+    args = {
+        'filename': None,
+        'output_filename': 'out.bufr',
+        'append': False,
+        'json': False,
+        'attributed': False,
+        'preamble': None,
+        'definitions_directory': None,
+        'tables_root_directory': None,
+        'master_table_number': None,
+        'master_table_version': None,
+        'compiled_template_cache_max': None,
+    }
+    args.update(kwargs)
+    return argparse.Namespace(**args)
 
-    def __getattr__(self, item):
-        return self.__dict__['_m'].get(item, None)
 
-
-def test_command_encode_with_append():
+@pytest.mark.parametrize('append', [True, False], ids=['append', 'preamble'])
+def test_command_encode_with_preamble(tmp_path, append):
     input_file = os.path.join(DATA_DIR, 'IUSK73_AMMC_182300.json')
-    output_dir = tempfile.mkdtemp()
-    output_file = os.path.join(output_dir, 'out.bufr')
-    with open(output_file, 'wb') as outs:
-        outs.write(b'IOBI01 SBBR 011100\r\r\n')
-    ns = NS(
-        {'filename': input_file, 'output_filename': output_file, 'append': True, 'json': True, ', attributed': False})
+    output_file = str(tmp_path / 'out.bufr')
+    preamble = 'IOBI01 SBBR 011100\r\r\n'
+    if append:  # The preamble is already in the file that the message is appended to
+        with open(output_file, 'wb') as outs:
+            outs.write(preamble.encode('utf-8'))
+        ns = encode_args(filename=input_file, output_filename=output_file, append=True, json=True)
+    else:
+        ns = encode_args(filename=input_file, output_filename=output_file, json=True, preamble=preamble)
 
     command_encode(ns)
     with open(output_file, 'rb') as ins:
         assert ins.read().startswith(b'IOBI01 SBBR 011100\r\r\n')
 
-    shutil.rmtree(output_dir, ignore_errors=True)
-
 
-def test_command_encode_with_preamble():
-    input_file = os.path.join(DATA_DIR, 'IUSK73_AMMC_182300.json')
-    output_dir = tempfile.mkdtemp()
-    output_file = os.path.join(output_dir, 'out.bufr')
-    ns = NS(
-        {'filename': input_file, 'output_filename': output_file, 'append': False, 'json': True, ', attributed': False,
-         'preamble': 'IOBI01 SBBR 011100\r\r\n'})
+def decode_args(**kwargs):
+    """Namespace of the decode command arguments with the defaults of the command line"""
+    args = {
+        'filenames': [],
+        'json': False,
+        'fast_json': False,
+        'attributed': False,
+        'multiple_messages': False,
+        'ignore_value_expectation': False,
+        'compiled_template_cache_max': None,
+        'continue_on_error': False,
+        'filter': None,
+        'definitions_directory': None,
+        'tables_root_directory': None,
+    }
+    args.update(kwargs)
+    return argparse.Namespace(**args)
 
-    command_encode(ns)
-    with open(output_file, 'rb') as ins:
-        assert ins.read().startswith(b'IOBI01 SBBR 011100\r\r\n')
 
-    shutil.rmtree(output_dir, ignore_errors=True)
+@pytest.mark.parametrize('attributed', [False, True], ids=['flat', 'nested'])
+def test_command_decode_fast_json(capsys, attributed):
+    input_file = os.path.join(DATA_DIR, 'uegabe.bufr')
+    command_decode(decode_args(filenames=[input_file], json=True, attributed=attributed))
+    default_output = capsys.readouterr().out
+    assert '\\u00ff' in default_output
+    command_decode(decode_args(filenames=[input_file], json=True, attributed=attributed, fast_json=True))
+    fast_output = capsys.readouterr().out
+    assert json.loads(fast_output) == json.loads(default_output)
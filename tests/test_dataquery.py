@@ -1,33 +1,28 @@
-from __future__ import absolute_import
-from __future__ import print_function
-
-import os
 import unittest
 
-# noinspection PyUnresolvedReferences
-from six.moves import range
-
 from pybufrkit.decoder import Decoder
 from pybufrkit.dataquery import NodePathParser, DataQuerent
 
-BASE_DIR = os.path.dirname(__file__)
-DATA_DIR = os.path.join(BASE_DIR, 'data')
-
-
-def read_bufr_file(file_name):
-    with open(os.path.join(DATA_DIR, file_name), 'rb') as ins:
-        s = ins.read()
-    return s
+from _fixtures import read_bufr_file
 
 
 class DataQueryTests(unittest.TestCase):
-    def setUp(self):
-        self.decoder = Decoder()
-        self.querent = DataQuerent(NodePathParser())
+    @classmethod
+    def setUpClass(cls):
+        cls.decoder = Decoder()
+        cls.querent = DataQuerent(NodePathParser())
+        cls.bufr_messages = {}
+
+    def decode(self, file_name):
+        # Queries only read the messages so each file is decoded once and shared
+        bufr_message = self.bufr_messages.get(file_name)
+        if bufr_message is None:
+            bufr_message = self.decoder.process(read_bufr_file(file_name))
+            self.bufr_messages[file_name] = bufr_message
+        return bufr_message
 
     def test_query_jaso_214(self):
-        s = read_bufr_file('jaso_214.bufr')
-        bufr_message = self.decoder.process(s)
+        bufr_message = self.decode('jaso_214.bufr')
 
         r1 = self.querent.query(bufr_message, '/301011/004001')
         assert r1.subset_indices() == list(range(128))
@@ -82,8 +77,7 @@ class DataQueryTests(unittest.TestCase):
         assert r8.all_values() == [[0] for _ in range(128)]
 
     def test_query_207003(self):
-        s = read_bufr_file('207003.bufr')
-        bufr_message = self.decoder.process(s)
+        bufr_message = self.decode('207003.bufr')
 
         r1 = self.querent.query(bufr_message, '/310060/301021/006001')
         assert r1.subset_indices() == [0, 1]
@@ -99,8 +93,7 @@ class DataQueryTests(unittest.TestCase):
         assert r3.all_values() == [[[[1], [2], [3], [4], [5]]]]
 
     def test_query_ISMD01_OKPR(self):
-        s = read_bufr_file('ISMD01_OKPR.bufr')
-        bufr_message = self.decoder.process(s)
+        bufr_message = self.decode('ISMD01_OKPR.bufr')
 
         r1 = self.querent.query(bufr_message, '/307080/301090/301004/001015')
         assert r1.subset_indices() == list(range(7))
@@ -117,8 +110,7 @@ class DataQueryTests(unittest.TestCase):
         assert r1.all_values() == values
 
     def test_query_amv2_87(self):
-        s = read_bufr_file('amv2_87.bufr')
-        bufr_message = self.decoder.process(s)
+        bufr_message = self.decode('amv2_87.bufr')
 
         r1 = self.querent.query(bufr_message, '/310195/303250/011001.033007')
         values = [
@@ -269,8 +261,7 @@ class DataQueryTests(unittest.TestCase):
         assert r2.all_values() == values
 
     def test_query_asr3_190(self):
-        s = read_bufr_file('asr3_190.bufr')
-        bufr_message = self.decoder.process(s)
+        bufr_message = self.decode('asr3_190.bufr')
 
         r1 = self.querent.query(bufr_message, '@[-1]/310028/101011/304037/012063.F12063')
         assert r1.subset_indices() == [127]
@@ -308,8 +299,7 @@ class DataQueryTests(unittest.TestCase):
         ]
 
     def test_query_mpco_217(self):
-        s = read_bufr_file('mpco_217.bufr')
-        bufr_message = self.decoder.process(s)
+        bufr_message = self.decode('mpco_217.bufr')
 
         r1 = self.querent.query(bufr_message, '@[-3:]/116000/106000/010004')
         assert r1.subset_indices() == [125, 126, 127]
@@ -340,8 +330,7 @@ class DataQueryTests(unittest.TestCase):
         ]
 
     def test_query_rado_250(self):
-        s = read_bufr_file('rado_250.bufr')
-        bufr_message = self.decoder.process(s)
+        bufr_message = self.decode('rado_250.bufr')
 
         r1 = self.querent.query(bufr_message, '/310226/107000/103000/015037.F15037.008023')
         assert r1.all_values(flat=True) == [[13] * 247]
@@ -360,8 +349,7 @@ class DataQueryTests(unittest.TestCase):
         ]]
 
     def test_descendant_ISMD01_OKPR(self):
-        s = read_bufr_file('ISMD01_OKPR.bufr')
-        bufr_message = self.decoder.process(s)
+        bufr_message = self.decode('ISMD01_OKPR.bufr')
 
         r1 = self.querent.query(bufr_message, '020012')
         assert r1.all_values(flat=True) == [
@@ -438,8 +426,7 @@ class DataQueryTests(unittest.TestCase):
         ]]
 
     def test_descendant_mpco_217(self):
-        s = read_bufr_file('mpco_217.bufr')
-        bufr_message = self.decoder.process(s)
+        bufr_message = self.decode('mpco_217.bufr')
 
         r1 = self.querent.query(bufr_message, '@[0] > 010004')
         assert r1.all_values(flat=True) == [
@@ -495,8 +482,7 @@ class DataQueryTests(unittest.TestCase):
         ]
 
     def test_contrived(self):
-        s = read_bufr_file('contrived.bufr')
-        bufr_message = self.decoder.process(s)
+        bufr_message = self.decode('contrived.bufr')
 
         r1 = self.querent.query(bufr_message, '/105002/102000/020011')
         assert r1.all_values(flat=True) == [
@@ -1,25 +1,15 @@
-from __future__ import absolute_import
-from __future__ import print_function
-
-import os
 import unittest
 
 from pybufrkit.decoder import Decoder, generate_bufr_message
 
-BASE_DIR = os.path.dirname(__file__)
-DATA_DIR = os.path.join(BASE_DIR, 'data')
-
-
-def read_bufr_file(file_name):
-    with open(os.path.join(DATA_DIR, file_name), 'rb') as ins:
-        s = ins.read()
-    return s
+from _fixtures import read_bufr_file
 
 
 class MessageGeneratorTests(unittest.TestCase):
 
-    def setUp(self):
-        self.decoder = Decoder()
+    @classmethod
+    def setUpClass(cls):
+        cls.decoder = Decoder()
 
     def test_can_continue_on_error(self):
         bufr_messages = [m for m in generate_bufr_message(
@@ -1,19 +1,10 @@
-import os
-
 import pytest
 
 from pybufrkit.errors import MetadataExprParsingError
 from pybufrkit.decoder import Decoder
 from pybufrkit.mdquery import MetadataExprParser, MetadataQuerent
 
-BASE_DIR = os.path.dirname(__file__)
-DATA_DIR = os.path.join(BASE_DIR, 'data')
-
-
-def read_bufr_file(file_name):
-    with open(os.path.join(DATA_DIR, file_name), 'rb') as ins:
-        s = ins.read()
-    return s
+from _fixtures import read_bufr_file
 
 
 metadata_expr_parser = MetadataExprParser()
@@ -21,29 +12,27 @@ md_querent = MetadataQuerent(metadata_expr_parser)
 decoder = Decoder()
 
 
-def test_simple_query():
-    s = read_bufr_file('jaso_214.bufr')
-    bufr_message = decoder.process(s)
+@pytest.fixture(scope='module')
+def bufr_message():
+    # Metadata queries only read the message so it is decoded once for the module
+    return decoder.process(read_bufr_file('jaso_214.bufr'))
+
+
+def test_simple_query(bufr_message):
     assert md_querent.query(bufr_message, '%length') == 5004
     assert md_querent.query(bufr_message, '%edition') == 3
 
 
-def test_default_is_first_match():
-    s = read_bufr_file('jaso_214.bufr')
-    bufr_message = decoder.process(s)
+def test_default_is_first_match(bufr_message):
     assert md_querent.query(bufr_message, '%section_length') == 18
 
 
-def test_explicit_section_index():
-    s = read_bufr_file('jaso_214.bufr')
-    bufr_message = decoder.process(s)
+def test_explicit_section_index(bufr_message):
     assert md_querent.query(bufr_message, '%3.section_length') == 154
     assert md_querent.query(bufr_message, '%4.section_length') == 4768
 
 
-def test_unexpanded_descriptors():
-    s = read_bufr_file('jaso_214.bufr')
-    bufr_message = decoder.process(s)
+def test_unexpanded_descriptors(bufr_message):
     assert md_querent.query(bufr_message, '%unexpanded_descriptors') == [
         1007, 25060, 1033, 2048, 2048, 5040, 201134,
         7001, 201000, 202131, 7005, 202000, 301011,
@@ -60,21 +49,15 @@ def test_unexpanded_descriptors():
     ]
 
 
-def test_stripping_whites():
-    s = read_bufr_file('jaso_214.bufr')
-    bufr_message = decoder.process(s)
+def test_stripping_whites(bufr_message):
     assert md_querent.query(bufr_message, '   %length  ') == 5004
 
 
-def test_non_exist_metadata():
-    s = read_bufr_file('jaso_214.bufr')
-    bufr_message = decoder.process(s)
+def test_non_exist_metadata(bufr_message):
     assert md_querent.query(bufr_message, '%blahblah') is None
 
 
-def test_non_exist_section():
-    s = read_bufr_file('jaso_214.bufr')
-    bufr_message = decoder.process(s)
+def test_non_exist_section(bufr_message):
     assert md_querent.query(bufr_message, '%9.length') is None
 
 
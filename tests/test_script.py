@@ -1,21 +1,12 @@
-from __future__ import print_function
-from __future__ import absolute_import
-
-import os
+import pytest
 
 from pybufrkit.decoder import Decoder
 from pybufrkit.script import process_embedded_query_expr, ScriptRunner
 
-BASE_DIR = os.path.dirname(__file__)
-DATA_DIR = os.path.join(BASE_DIR, 'data')
-
-decoder = Decoder()
+from _fixtures import read_bufr_file
 
 
-def read_bufr_file(file_name):
-    with open(os.path.join(DATA_DIR, file_name), 'rb') as ins:
-        s = ins.read()
-    return s
+decoder = Decoder()
 
 
 def test_pragma():
@@ -34,22 +25,19 @@ def test_pragma():
     assert runner.pragma['data_values_nest_level'] == 0
 
 
-def test_embedded_query():
-    script = 'length = ${%length}; v = ${001001}'
-    s, variables = process_embedded_query_expr(script)
-    assert s == 'length = PBK_0; v = PBK_1'
-
-
-def test_no_processing_comments():
-    script = 'length = ${%length}  # length = ${%length}\nsomething = ${001001}'
-    s, variables = process_embedded_query_expr(script)
-    assert s == 'length = PBK_0  # length = ${%length}\nsomething = PBK_1'
-
-
-def test_single_var_for_multi_instances_of_same_query_expr():
-    script = 'length = ${%length}\nanother_length = ${%length}'
+@pytest.mark.parametrize('script, expected', [
+    ('length = ${%length}; v = ${001001}', 'length = PBK_0; v = PBK_1'),
+    # No processing in comments
+    ('length = ${%length}  # length = ${%length}\nsomething = ${001001}',
+     'length = PBK_0  # length = ${%length}\nsomething = PBK_1'),
+    # No processing in quotes
+    ('a = "${%length}" + ${ %length }', 'a = "${%length}" + PBK_0'),
+    # Single variable for multiple instances of the same query expression
+    ('length = ${%length}\nanother_length = ${%length}', 'length = PBK_0\nanother_length = PBK_0'),
+], ids=['embedded_query', 'no_processing_comments', 'no_processing_quotes', 'single_var_for_same_query_expr'])
+def test_process_embedded_query_expr(script, expected):
     s, variables = process_embedded_query_expr(script)
-    assert s == 'length = PBK_0\nanother_length = PBK_0'
+    assert s == expected
 
 
 def test_assignment():
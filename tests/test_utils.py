@@ -1,11 +1,16 @@
-import os
+import functools
+import json
 
+import pytest
+
+from pybufrkit import utils
 from pybufrkit.decoder import Decoder
 from pybufrkit.renderer import FlatTextRenderer, NestedTextRenderer, FlatJsonRenderer, NestedJsonRenderer
-from pybufrkit.utils import nested_json_to_flat_json, flat_text_to_flat_json, nested_text_to_flat_json
+from pybufrkit.utils import (nested_json_to_flat_json, flat_text_to_flat_json, nested_text_to_flat_json,
+                             flag_bits_of_int, flatten_list, json_dumps, _literal_eval, JSON_DUMPS_KWARGS)
+
+from _fixtures import read_bufr_file
 
-BASE_DIR = os.path.dirname(__file__)
-DATA_DIR = os.path.join(BASE_DIR, 'data')
 
 FILES = (
     '207003.bufr',
@@ -26,12 +31,6 @@ FILES = (
 )
 
 
-def read_bufr_file(file_name):
-    with open(os.path.join(DATA_DIR, file_name), 'rb') as ins:
-        s = ins.read()
-    return s
-
-
 decoder = Decoder()
 flat_text_renderer = FlatTextRenderer()
 nested_text_renderer = NestedTextRenderer()
@@ -39,37 +38,99 @@ flat_json_renderer = FlatJsonRenderer()
 nested_json_renderer = NestedJsonRenderer()
 
 
-def test_nested_json_to_flat_json():
-    def func(filename):
-        s = read_bufr_file(filename)
-        bufr_message = decoder.process(s)
-        nested = nested_json_renderer.render(bufr_message)
-        flat = flat_json_renderer.render(bufr_message)
-        assert flat == nested_json_to_flat_json(nested)
+@functools.lru_cache(maxsize=None)
+def decode(filename):
+    # The conversion tests only read the messages so each file is decoded once
+    return decoder.process(read_bufr_file(filename))
+
+
+@functools.lru_cache(maxsize=None)
+def render_flat_json(filename):
+    # The expected result of every conversion test, which only compares against it
+    return flat_json_renderer.render(decode(filename))
+
+
+@pytest.mark.parametrize('filename', FILES)
+def test_nested_json_to_flat_json(filename):
+    bufr_message = decode(filename)
+    nested = nested_json_renderer.render(bufr_message)
+    assert render_flat_json(filename) == nested_json_to_flat_json(nested)
+
+
+@pytest.mark.parametrize('filename', FILES)
+def test_flat_text_to_flat_json(filename):
+    bufr_message = decode(filename)
+    flat_text = flat_text_renderer.render(bufr_message)
+    flat_json = flat_text_to_flat_json(flat_text)
+    assert flat_json == render_flat_json(filename)
+
+
+@pytest.mark.parametrize('filename', FILES)
+def test_nested_text_to_flat_json(filename):
+    bufr_message = decode(filename)
+    nested_text = nested_text_renderer.render(bufr_message)
+    flat_json = nested_text_to_flat_json(nested_text)
+    assert flat_json == render_flat_json(filename)
+
+
+def test_flag_bits_of_int():
+    assert flag_bits_of_int(0, 4) == []
+    assert flag_bits_of_int(0b1001, 4) == [1, 4]
+    for value in range(2 ** 9):
+        assert flag_bits_of_int(value, 9) == [
+            i + 1 for i, bit in enumerate('{:09b}'.format(value)) if bit == '1']
+    # Only bits within nbits are valid bit numbers
+    assert flag_bits_of_int(255, 4) == [1, 2, 3, 4]
+    assert flag_bits_of_int(0b10001, 4) == [4]
+
+
+def test_flatten_list():
+    assert flatten_list([]) == []
+    assert flatten_list([1, [2, [3, []], 4], [[5]], 6]) == [1, 2, 3, 4, 5, 6]
+
+
+def test_json_dumps():
+    s = json_dumps({'a': [1, 2.5, None, b'\xe9x'], 'b': True})
+    assert json.loads(s) == {'a': [1, 2.5, None, u'\xe9x'], 'b': True}
+
+
+@pytest.mark.parametrize('renderer', [flat_json_renderer, nested_json_renderer], ids=['flat', 'nested'])
+def test_json_dumps_branches(monkeypatch, renderer):
+    # This message has bytes values above 0x7f
+    data = renderer.render(decode('uegabe.bufr'))
+    expected = json.dumps(data, **JSON_DUMPS_KWARGS)
+    assert '\\u00ff' in expected
+
+    # The default output does not depend on whether orjson is installed
+    assert json_dumps(data) == expected
+    monkeypatch.setattr(utils, 'orjson', None)
+    assert json_dumps(data) == expected
+    assert json_dumps(data, fast=True) == expected
+
 
-    for filename in FILES:
-        func(filename)
+@pytest.mark.parametrize('renderer', [flat_json_renderer, nested_json_renderer], ids=['flat', 'nested'])
+def test_json_dumps_fast_with_orjson(renderer):
+    pytest.importorskip('orjson')
+    data = renderer.render(decode('uegabe.bufr'))
+    s = json_dumps(data, fast=True)
+    assert u'\xff' in s
+    assert json.loads(s) == json.loads(json.dumps(data, **JSON_DUMPS_KWARGS))
 
 
-def test_flat_text_to_flat_json():
-    def func(filename):
-        s = read_bufr_file(filename)
-        bufr_message = decoder.process(s)
-        flat_text = flat_text_renderer.render(bufr_message)
-        flat_json = flat_text_to_flat_json(flat_text)
-        assert flat_json == flat_json_renderer.render(bufr_message)
+def test_json_dumps_fast_with_non_finite_floats():
+    # orjson would write NaN and infinity as null
+    for value in (float('nan'), float('inf'), -float('inf')):
+        data = {'v': [1.5, (b'\xe9', {'x': value})]}
+        assert json_dumps(data, fast=True) == json.dumps(data, **JSON_DUMPS_KWARGS)
 
-    for filename in FILES:
-        func(filename)
 
+def test_literal_eval():
+    for value in (0, -12, 3.5, -1e-05, None, b'', b'ABC 12', b"it's", b'a\\b', b'\xff', (b'x', 1)):
+        assert _literal_eval(repr(value)) == value
 
-def test_nested_text_to_flat_json():
-    def func(filename):
-        s = read_bufr_file(filename)
-        bufr_message = decoder.process(s)
-        nested_text = nested_text_renderer.render(bufr_message)
-        flat_json = nested_text_to_flat_json(nested_text)
-        assert flat_json == flat_json_renderer.render(bufr_message)
 
-    for filename in FILES:
-        func(filename)
+def test_literal_eval_does_not_share_mutable_values():
+    value = _literal_eval('(5, [1, 3])')
+    value[1].append(9)
+    assert _literal_eval('(5, [1, 3])') == (5, [1, 3])
+    assert _literal_eval("b'\\xff'") is _literal_eval("b'\\xff'")